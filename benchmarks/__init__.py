@@ -0,0 +1,2 @@
+"""Benchmark scripts for the games. Run them from the repository root, e.g.
+``python -m benchmarks.bench_tictactoe_board``."""
@@ -0,0 +1,66 @@
+"""
+Snake arena tick cost against the SPEED tick budget.
+
+Runs snake_arena.Arena headless: first with a growing number of snakes on
+a 500x500 board, then 500 snakes with plenty of food so the bodies grow,
+to show that a tick scales with the snake count and not with body length.
+The last line adds the window's draw on the headless canvas.
+
+    python -m benchmarks.bench_arena
+"""
+import argparse
+import time
+
+import headless
+import snake_arena
+from snake_game import SPEED
+from telemetry import Histogram
+
+
+def time_ticks(arena, ticks):
+    histogram = Histogram()
+    for _ in range(ticks):
+        start = time.perf_counter_ns()
+        arena.tick()
+        histogram.record((time.perf_counter_ns() - start) // 1000)
+    return histogram
+
+
+def body_cells(arena):
+    return sum(len(snake.body) for snake in arena.snakes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake arena ms/tick.")
+    parser.add_argument("--size", type=int, default=snake_arena.ARENA_SIZE)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+    print(f"{args.size}x{args.size} arena, budget {SPEED}ms per tick")
+
+    print(f"{'snakes':>7} {'body cells':>11} {'mean ms':>8} {'p99 ms':>7}")
+    for snakes in (100, 250, 500, 1000):
+        arena = snake_arena.Arena(args.size, args.size, snakes, seed=0)
+        histogram = time_ticks(arena, args.ticks)
+        print(f"{snakes:>7} {body_cells(arena):>11,} {histogram.total / histogram.count / 1000:>8.2f}"
+              f" {histogram.percentile(0.99) / 1000:>7.2f}")
+
+    print("\n500 snakes with 50,000 food items: bodies grow, tick cost should not")
+    print(f"{'ticks':>11} {'body cells':>11} {'mean ms':>8} {'p99 ms':>7}")
+    arena = snake_arena.Arena(args.size, args.size, 500, food_items=50000, seed=0)
+    for window in range(5):
+        histogram = time_ticks(arena, args.ticks)
+        print(f"{window * args.ticks:>5}-{(window + 1) * args.ticks:<5} {body_cells(arena):>11,}"
+              f" {histogram.total / histogram.count / 1000:>8.2f} {histogram.percentile(0.99) / 1000:>7.2f}")
+
+    module = headless.load_game_module("snake_arena")
+    root = module.build_window(args.size, args.size, 500, seed=0)
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        root.run_scheduled()
+    elapsed = (time.perf_counter() - start) / args.ticks * 1000
+    print(f"\ntick + draw in the window (headless canvas): {elapsed:.2f}ms per turn"
+          f" ({'within' if elapsed <= SPEED else 'OVER'} the {SPEED}ms budget)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""
+Per-frame benchmarks for the four games' hot paths.
+
+Each game is driven by a scripted player for a fixed number of ticks, on the
+headless recording canvas and, when a display is available, on a real Tk
+Canvas. Reports ns/frame, canvas calls per frame, allocation figures and
+the canvas calls saved by scene.Scene layers, and can save results as a
+JSON baseline or compare against one. The timed run is repeated (taking
+turns with the other games) on a fresh, identically seeded game and the
+fastest repeat is kept, so --compare checks best against best instead of
+one noisy mean. Back-to-back runs on a shared machine still differ by up
+to 10%, so the default --tolerance is 25%; lower it on a quiet, dedicated
+one. Canvas calls per frame are exact and compared with no slack:
+
+    python -m benchmarks.bench_frames --save baseline.json
+    python -m benchmarks.bench_frames --compare baseline.json
+"""
+import argparse
+import importlib
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import types
+from collections import Counter
+
+import headless
+
+CANVAS_METHODS = (
+    "create_rectangle", "create_oval", "create_line", "create_text", "create_window",
+    "coords", "move", "itemconfig", "delete", "bbox", "find_overlapping", "tag_raise",
+)
+TICKS = {"breakout": 2000, "flappy": 2000, "snake": 1000, "tictactoe": 2000}
+ALLOC_TICKS = 200
+REPEATS = 5 # Timed runs per game; ns/frame is the fastest
+TOLERANCE = 0.25 # Relative slowdown of the fastest run allowed before it counts as a regression
+
+
+def count_canvas_calls(canvas):
+    """Wraps a real Canvas' methods so calls are counted like on HeadlessCanvas."""
+    canvas.calls = Counter()
+    for name in CANVAS_METHODS:
+        method = getattr(canvas, name)
+
+        def counted(*args, _name=name, _method=method, **kwargs):
+            canvas.calls[_name] += 1
+            return _method(*args, **kwargs)
+        setattr(canvas, name, counted)
+    return canvas
+
+
+def hold_after_calls(root):
+    """Queues a real root's after() callbacks so the driver runs the clock."""
+    if isinstance(root, headless.HeadlessRoot):
+        return root
+    root.scheduled = []
+
+    def after(ms, func=None, *args):
+        root.scheduled.append((None, ms, func, args))
+
+    def run_scheduled():
+        pending, root.scheduled = root.scheduled, []
+        for _, _, func, args in pending:
+            func(*args)
+        return len(pending)
+    root.after = after
+    root.run_scheduled = run_scheduled
+    return root
+
+
+# --- Game Drivers ---
+# A driver's decide() looks at the game state and returns the scripted input
+# for this tick; only the input and the tick itself are measured.
+
+class BreakoutDriver:
+    @property
+    def scenes(self):
+        return [self.game.hud]
+
+    def __init__(self, module, real):
+        self.module = module
+        self.real = real
+        self.root = hold_after_calls(module.tk.Tk())
+        self.new_game()
+
+    def new_game(self):
+        if hasattr(self, "game"):
+            self.game.canvas.destroy()
+        self.game = self.module.BreakoutGame(self.root)
+        if self.real:
+            count_canvas_calls(self.game.canvas)
+        self.game.start_game()
+
+    @property
+    def canvas(self):
+        return self.game.canvas
+
+    def decide(self):
+        if self.game.game_over:
+            self.new_game()
+        ball = self.game.canvas.coords(self.game.ball)
+        paddle = self.game.canvas.coords(self.game.paddle)
+        offset = (ball[0] + ball[2]) / 2 - (paddle[0] + paddle[2]) / 2
+        if abs(offset) > 10:
+            event = types.SimpleNamespace(keysym="Left" if offset < 0 else "Right")
+            return lambda: self.game.move_paddle(event)
+        return None
+
+    def tick(self):
+        self.root.run_scheduled()
+
+
+class FlappyDriver:
+    @property
+    def scenes(self):
+        return [self.game.modal]
+
+    def __init__(self, module, real):
+        self.module = module
+        self.root = hold_after_calls(module.tk.Tk())
+        self.game = module.FlappyHorse(self.root)
+        if real:
+            count_canvas_calls(self.game.canvas)
+        self.game.start_game()
+
+    @property
+    def canvas(self):
+        return self.game.canvas
+
+    def decide(self):
+        game = self.game
+        if game.is_game_over:
+            game.start_game()
+        target = self.module.HEIGHT / 2
+        for pipe in game.pipes:
+            top = game.canvas.coords(pipe["top_main"])
+            if top and top[2] > self.module.WIDTH / 4 - 20:
+                target = top[3] + self.module.PIPE_GAP / 2
+                break
+        if game.horse_y > target + 20 and game.horse_velocity > 0:
+            return game.jump
+        return None
+
+    def tick(self):
+        self.root.run_scheduled()
+
+
+class SnakeDriver:
+    MOVES = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+
+    @property
+    def scenes(self):
+        return [self.module.scene]
+
+    def __init__(self, module, real):
+        self.module = module
+        self.root = hold_after_calls(module.build_window())
+        if real:
+            count_canvas_calls(module.canvas)
+
+    @property
+    def canvas(self):
+        return self.module.canvas
+
+    def decide(self):
+        m = self.module
+        if not self.root.scheduled:
+            m.restart_game()
+        # The snake and food the next turn will move: next_turn replaces the food
+        # in a local after each meal, so the module's food global goes stale
+        _, _, _, (snake, food) = self.root.scheduled[-1]
+        x, y = snake.coordinates[0]
+        fx, fy = food.coordinates
+        body = {tuple(part) for part in snake.coordinates[:-1]}
+
+        def score(name):
+            dx, dy = self.MOVES[name]
+            nx, ny = x + dx * m.SPACE_SIZE, y + dy * m.SPACE_SIZE
+            blocked = not (0 <= nx < m.GAME_WIDTH and 0 <= ny < m.GAME_HEIGHT) or (nx, ny) in body
+            return (blocked, abs(fx - nx) + abs(fy - ny))
+        best = min(self.MOVES, key=score)
+        return lambda: m.change_direction(best)
+
+    def tick(self):
+        self.root.run_scheduled()
+
+
+class TicTacToeDriver:
+    scenes = []
+
+    def __init__(self, module, real):
+        self.game = module.TicTacToe()
+        self.game.show_end_game_popup = lambda message: None
+        if real:
+            count_canvas_calls(self.game.canvas)
+        self.rng = random.Random(0)
+        self.move = None
+
+    @property
+    def canvas(self):
+        return self.game.canvas
+
+    def decide(self):
+        game = self.game
+        if game.game_over:
+            game.reset_game()
+        empty = [(r, c) for r in range(game.board_size) for c in range(game.board_size) if game.board[r][c] == ""]
+        self.move = self.rng.choice(empty)
+        return None
+
+    def tick(self):
+        self.game.on_button_click(*self.move)
+
+
+GAMES = {
+    "breakout": ("break_out", BreakoutDriver),
+    "flappy": ("flappyHorse", FlappyDriver),
+    "snake": ("snake_game", SnakeDriver),
+    "tictactoe": ("tick_tack_toe", TicTacToeDriver),
+}
+
+
+def run_frames(driver, ticks, on_frame=None):
+    """Runs scripted frames; returns (nanoseconds spent in measured work, canvas calls)."""
+    elapsed = 0.0
+    calls = 0
+    for _ in range(ticks):
+        action = driver.decide()
+        before = sum(driver.canvas.calls.values())
+        if on_frame:
+            on_frame(True)
+        start = time.perf_counter_ns()
+        if action:
+            action()
+        driver.tick()
+        elapsed += time.perf_counter_ns() - start
+        if on_frame:
+            on_frame(False)
+        calls += sum(driver.canvas.calls.values()) - before
+    return elapsed, calls
+
+
+def measure(game, backend, ticks, allocations=True):
+    module_name, driver_class = GAMES[game]
+    random.seed(0)
+    if backend == "headless":
+        module = headless.load_game_module(module_name)
+    else:
+        module = importlib.import_module(module_name)
+    driver = driver_class(module, real=backend == "tk")
+
+    run_frames(driver, min(ticks, 50)) # Warm up
+    saved_before = sum(scene.naive_ops - scene.ops for scene in driver.scenes)
+    elapsed, calls = run_frames(driver, ticks)
+    saved = sum(scene.naive_ops - scene.ops for scene in driver.scenes) - saved_before
+    result = {
+        "ticks": ticks,
+        "ns_per_frame": elapsed / ticks,
+        "canvas_calls_per_frame": calls / ticks,
+        "scene_ops_saved_per_frame": saved / ticks,
+    }
+
+    if allocations:
+        # Allocation pass: peak traced memory inside each frame, and blocks kept across frames
+        peaks = []
+
+        def on_frame(starting):
+            if starting:
+                tracemalloc.reset_peak()
+                on_frame.base = tracemalloc.get_traced_memory()[0]
+            else:
+                peaks.append(tracemalloc.get_traced_memory()[1] - on_frame.base)
+        tracemalloc.start()
+        blocks_before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        run_frames(driver, ALLOC_TICKS, on_frame)
+        blocks_after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        tracemalloc.stop()
+        result["alloc_peak_bytes_per_frame"] = sum(peaks) / len(peaks)
+        result["retained_blocks_per_frame"] = (blocks_after - blocks_before) / ALLOC_TICKS
+
+    if backend == "tk":
+        root = getattr(driver, "root", None) or driver.game
+        root.destroy()
+    return result
+
+
+def display_available():
+    try:
+        import tkinter
+        tkinter.Tk().destroy()
+        return True
+    except Exception:
+        return False
+
+
+def compare(results, baseline, tolerance):
+    """Prints changes against a baseline; returns True if anything regressed."""
+    regressed = False
+    for key, result in results.items():
+        old = baseline.get("results", {}).get(key)
+        if old is None:
+            continue
+        notes = []
+        for metric, slack in (("ns_per_frame", tolerance), ("canvas_calls_per_frame", 0.0),
+                              ("alloc_peak_bytes_per_frame", tolerance)):
+            if old[metric] and result[metric] > old[metric] * (1 + slack) + 1e-9:
+                notes.append(f"{metric} {old[metric]:.1f} -> {result[metric]:.1f}")
+        if notes:
+            regressed = True
+            print(f"REGRESSION {key}: " + ", ".join(notes))
+    if not regressed:
+        print("No regressions against the baseline.")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame benchmarks for the games.")
+    parser.add_argument("games", nargs="*", help="games to run: " + ", ".join(GAMES) + " (default: all)")
+    parser.add_argument("--backend", choices=["headless", "tk", "both"], default="both")
+    parser.add_argument("--ticks", type=int, help="frames per game (default depends on the game)")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="timed runs per game; the fastest is reported")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="relative ns/frame and allocation growth allowed (default: %(default)s)")
+    args = parser.parse_args()
+    unknown = set(args.games) - set(GAMES)
+    if unknown:
+        parser.error("unknown games: " + ", ".join(sorted(unknown)))
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+
+    backends = ["headless", "tk"] if args.backend == "both" else [args.backend]
+    if "tk" in backends and not display_available():
+        print("No display: skipping the real Tk Canvas backend.")
+        backends.remove("tk")
+
+    results = {}
+    # Repeats go round all the games in turn, so a slow spell on the machine
+    # lands on one run of each game instead of on every run of one game
+    for repeat in range(args.repeats):
+        for game in args.games or GAMES:
+            for backend in backends:
+                result = measure(game, backend, args.ticks or TICKS[game], allocations=not repeat)
+                key = f"{game}/{backend}"
+                if repeat:
+                    results[key]["ns_per_frame"] = min(results[key]["ns_per_frame"], result["ns_per_frame"])
+                else:
+                    results[key] = result
+
+    print(f"{'game/backend':<20} {'ns/frame':>12} {'calls/frame':>12} {'peak B/frame':>13} {'kept blk/frame':>15}"
+          f" {'scene saved':>12}")
+    for key, result in results.items():
+        print(f"{key:<20} {result['ns_per_frame']:>12,.0f} {result['canvas_calls_per_frame']:>12.2f}"
+              f" {result['alloc_peak_bytes_per_frame']:>13,.0f} {result['retained_blocks_per_frame']:>15.2f}"
+              f" {result['scene_ops_saved_per_frame']:>12.2f}")
+
+    if args.save:
+        meta = {"python": sys.version.split()[0], "platform": platform.platform(), "time": time.time(),
+                "repeats": args.repeats}
+        with open(args.save, "w") as out:
+            json.dump({"meta": meta, "results": results}, out, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            if compare(results, json.load(baseline_file), args.tolerance):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Particle system frame cost at 10,000 live particles.
+
+Fills a ParticleSystem to capacity, then times update() and render() per
+frame against the Breakout (10ms) and Flappy Horse (15ms) tick budgets, on
+the headless canvas and, when a display is available, on a real Tk Canvas.
+Two loads are measured: particles that all stay alive, and churn, where
+particles expire every frame and emission refills the system to capacity.
+
+    python -m benchmarks.bench_particles
+"""
+import argparse
+import random
+import time
+
+import headless
+from benchmarks.bench_frames import count_canvas_calls, display_available, hold_after_calls
+from particles import CAPACITY, ParticleSystem
+
+BUDGETS_MS = {"breakout": 10, "flappy": 15}
+FRAMES = 200
+
+
+def make_system(backend):
+    if backend == "headless":
+        root = headless.HeadlessRoot()
+        canvas = headless.HeadlessCanvas(root, width=800, height=600)
+    else:
+        import tkinter
+        root = tkinter.Tk()
+        canvas = count_canvas_calls(tkinter.Canvas(root, width=800, height=600))
+        canvas.pack()
+    hold_after_calls(root) # Frames are driven here, not by the system's own after() loop
+    return root, ParticleSystem(root, canvas, spawn_budget=CAPACITY, rng=random.Random(0))
+
+
+def measure(backend, load, frames):
+    root, system = make_system(backend)
+    if load == "steady":
+        system.emit(400, 300, CAPACITY, "#f1c40f", life=60000)
+    else:
+        # Fill up with lifetimes spread over 60 frames, then refill what expires each frame
+        for _ in range(60):
+            system.emit(400, 300, CAPACITY // 60 + 1, "#e67e22", life=120)
+            system.update()
+
+    system.render() # Warm up: creates the item pool
+    emit_ns = update_ns = render_ns = 0
+    live = 0
+    calls_before = sum(system.canvas.calls.values())
+    for _ in range(frames):
+        start = time.perf_counter_ns()
+        if load == "churn":
+            system.emit(400, 300, CAPACITY - system.count, "#e67e22", life=120)
+        emitted = time.perf_counter_ns()
+        emit_ns += emitted - start
+        live += system.count
+        start = emitted
+        system.update()
+        middle = time.perf_counter_ns()
+        system.render()
+        if backend == "tk":
+            root.update_idletasks() # Let Tk redraw so the real cost shows up
+        render_ns += time.perf_counter_ns() - middle
+        update_ns += middle - start
+    calls = sum(system.canvas.calls.values()) - calls_before
+    if backend == "tk":
+        root.destroy()
+    return {
+        "live_particles": live / frames,
+        "emit_ms": emit_ns / frames / 1e6,
+        "update_ms": update_ns / frames / 1e6,
+        "render_ms": render_ns / frames / 1e6,
+        "frame_ms": (emit_ns + update_ns + render_ns) / frames / 1e6,
+        "canvas_calls_per_frame": calls / frames,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Particle system cost per frame.")
+    parser.add_argument("--backend", choices=["headless", "tk", "both"], default="both")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    args = parser.parse_args()
+
+    backends = ["headless", "tk"] if args.backend == "both" else [args.backend]
+    if "tk" in backends and not display_available():
+        print("No display: skipping the real Tk Canvas backend.")
+        backends.remove("tk")
+
+    print(f"{'backend/load':<16} {'live':>8} {'emit ms':>8} {'update ms':>10} {'render ms':>10} {'frame ms':>9} {'calls':>7}  budgets")
+    for backend in backends:
+        for load in ("steady", "churn"):
+            result = measure(backend, load, args.frames)
+            verdict = "  ".join(
+                f"{game} {'ok' if result['frame_ms'] <= budget else 'OVER'} ({budget}ms)"
+                for game, budget in BUDGETS_MS.items()
+            )
+            print(f"{backend + '/' + load:<16} {result['live_particles']:>8,.0f} {result['emit_ms']:>8.2f}"
+                  f" {result['update_ms']:>10.2f}"
+                  f" {result['render_ms']:>10.2f} {result['frame_ms']:>9.2f}"
+                  f" {result['canvas_calls_per_frame']:>7.0f}  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
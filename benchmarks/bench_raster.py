@@ -0,0 +1,88 @@
+"""
+Off-screen rendering cost per frame, and headless video capture.
+
+Plays each game headless with the scripted players from bench_frames and
+draws every frame with raster.py. Reports the render and downscale cost
+per frame; with --video, each game's frames are also written to
+DIR/<game>.rgb, and the ffmpeg line that converts them is printed.
+
+    python -m benchmarks.bench_raster --video /tmp/frames
+"""
+import argparse
+import os
+import random
+import time
+
+import headless
+import raster
+from benchmarks.bench_frames import BreakoutDriver, FlappyDriver, SnakeDriver
+
+# Game -> (module, driver, renderer, frames per second of the game loop)
+GAMES = {
+    "snake": ("snake_game", SnakeDriver, raster.SnakeRenderer, 10),
+    "breakout": ("break_out", BreakoutDriver, raster.BreakoutRenderer, 100),
+    "flappy": ("flappyHorse", FlappyDriver, raster.FlappyRenderer, 66),
+}
+FRAMES = 300
+SCALE = 4
+
+
+def measure(game, frames, scale, video_dir=None):
+    module_name, driver_class, renderer_class, fps = GAMES[game]
+    random.seed(0)
+    module = headless.load_game_module(module_name)
+    driver = driver_class(module, real=False)
+    renderer = renderer_class(module)
+    frame = None
+    video = None
+    if video_dir:
+        video = raster.VideoWriter(os.path.join(video_dir, game + ".rgb"), renderer.shape, fps)
+
+    render_ns = downscale_ns = write_ns = 0
+    for _ in range(frames):
+        action = driver.decide()
+        if action:
+            action()
+        driver.tick()
+        state = module if game == "snake" else driver.game
+        start = time.perf_counter_ns()
+        frame = renderer.render(state, out=frame)
+        rendered = time.perf_counter_ns()
+        raster.downscale(frame, scale)
+        downscaled = time.perf_counter_ns()
+        if video:
+            video.write(frame)
+        render_ns += rendered - start
+        downscale_ns += downscaled - rendered
+        write_ns += time.perf_counter_ns() - downscaled
+    command = None
+    if video:
+        video.close()
+        command = video.command(os.path.join(video_dir, game + ".mp4"))
+    return render_ns / frames / 1e6, downscale_ns / frames / 1e6, write_ns / frames / 1e6, renderer.shape, command
+
+
+def main():
+    parser = argparse.ArgumentParser(description="raster.py cost per frame.")
+    parser.add_argument("games", nargs="*", help="games to run: " + ", ".join(GAMES) + " (default: all)")
+    parser.add_argument("--frames", type=int, default=FRAMES)
+    parser.add_argument("--scale", type=int, default=SCALE, help="downscale factor for observations")
+    parser.add_argument("--video", metavar="DIR", help="also write raw rgb24 video files to DIR")
+    args = parser.parse_args()
+    unknown = set(args.games) - set(GAMES)
+    if unknown:
+        parser.error("unknown games: " + ", ".join(sorted(unknown)))
+    if args.video:
+        os.makedirs(args.video, exist_ok=True)
+
+    print(f"{'game':<10} {'frame':>13} {'render ms':>10} {'downscale ms':>13} {'write ms':>9}")
+    for game in args.games or GAMES:
+        render_ms, downscale_ms, write_ms, shape, command = measure(game, args.frames, args.scale, args.video)
+        size = f"{shape[1]}x{shape[0]}"
+        print(f"{game:<10} {size:>13} {render_ms:>10.2f} {downscale_ms:>13.2f} {write_ms:>9.2f}")
+        if command:
+            print(f"  to convert: {command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Self-play record throughput against the number of producer processes.
+
+Generates the same number of games with 1, 2, 4, ... workers up to the core
+count, writes them through the dedupe filter, and reads the file back with
+the lazy reader:
+
+    python -m benchmarks.bench_selfplay --size 9 --win-length 5
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import selfplay
+
+
+def run(size, win_length, engines, games, workers, path):
+    start = time.perf_counter()
+    positions = 0
+
+    def counted(stream):
+        nonlocal positions
+        for item in stream:
+            positions += 1
+            yield item
+    stream = selfplay.produce(size, win_length, engines, games, workers)
+    written = selfplay.write_records(path, size, win_length, selfplay.dedupe(counted(stream)))
+    return positions, written, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Self-play records/s against worker count.")
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--win-length", type=int, default=5)
+    parser.add_argument("--engines", nargs=2, choices=sorted(selfplay.ENGINES), default=["random", "random"])
+    parser.add_argument("--games", type=int, default=2000)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+
+    path = os.path.join(tempfile.mkdtemp(), "selfplay.bin")
+    print(f"{args.size}x{args.size}, {args.win_length} in a row, {' vs '.join(args.engines)}, "
+          f"{args.games} games, {cores} cores")
+    print(f"{'workers':>8} {'records':>9} {'unique':>9} {'seconds':>8} {'records/s':>11} {'speedup':>8}")
+    base = None
+    for workers in counts:
+        positions, written, elapsed = run(args.size, args.win_length, args.engines, args.games, workers, path)
+        rate = positions / elapsed
+        base = base or rate
+        print(f"{workers:>8} {positions:>9,} {written:>9,} {elapsed:>8.2f} {rate:>11,.0f} {rate / base:>7.2f}x")
+
+    start = time.perf_counter()
+    read = sum(1 for _ in selfplay.read_records(path))
+    elapsed = time.perf_counter() - start
+    print(f"read back {read:,} records in {elapsed:.2f}s ({read / elapsed:,.0f} records/s), "
+          f"{os.path.getsize(path) / max(read, 1):.1f} bytes/record on disk")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Measures Tic-Tac-Toe window startup and reset time against board size,
+comparing the single-canvas board with the old one-Button-per-cell grid.
+Needs a display (a real one or Xvfb).
+"""
+import argparse
+import time
+import tkinter as tk
+
+from tick_tack_toe import TicTacToe
+
+SIZES = [3, 5, 9, 13, 19]
+RESETS = 20
+
+
+class ButtonGridBoard(tk.Tk):
+    """The previous widget-per-cell board, kept here only as a baseline."""
+    def __init__(self, board_size):
+        super().__init__()
+        self.board_size = board_size
+        frame = tk.Frame(self)
+        frame.pack()
+        self.buttons = []
+        for r in range(board_size):
+            for c in range(board_size):
+                button = tk.Button(frame, text="", width=4, height=2, relief="flat",
+                                   command=lambda r=r, c=c: None)
+                button.grid(row=r, column=c, padx=5, pady=5)
+                button.bind("<Enter>", lambda e, b=button: b.config(bg="#4a6274"))
+                button.bind("<Leave>", lambda e, b=button: b.config(bg="#34495e"))
+                self.buttons.append(button)
+
+    def fill_half(self):
+        for button in self.buttons[::2]:
+            button.config(text="X", state="disabled")
+
+    def reset_game(self):
+        for button in self.buttons:
+            button.config(text="", state="normal", bg="#34495e")
+
+
+def fill_half(app):
+    """Plays every other cell so that reset has real work to undo."""
+    for r in range(app.board_size):
+        for c in range(app.board_size):
+            if (r * app.board_size + c) % 2 == 0 and not app.game_over:
+                app.board[r][c] = "X"
+                app._draw_mark(r, c, "X")
+
+
+def measure(factory, fill, size):
+    """Returns (startup ms, mean reset ms) for one board size."""
+    start = time.perf_counter()
+    app = factory(size)
+    app.update()
+    startup = time.perf_counter() - start
+
+    total = 0.0
+    for _ in range(RESETS):
+        fill(app)
+        app.update()
+        start = time.perf_counter()
+        app.reset_game()
+        app.update()
+        total += time.perf_counter() - start
+    app.destroy()
+    return startup * 1000, total / RESETS * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    args = parser.parse_args()
+
+    try:
+        tk.Tk().destroy()
+    except tk.TclError as error:
+        raise SystemExit(f"No display available: {error}")
+
+    print(f"{'size':>5} {'cells':>6} | {'canvas start':>12} {'reset':>8} | {'buttons start':>13} {'reset':>8}")
+    for size in args.sizes:
+        canvas_start, canvas_reset = measure(lambda n: TicTacToe(board_size=n), fill_half, size)
+        button_start, button_reset = measure(ButtonGridBoard, ButtonGridBoard.fill_half, size)
+        print(f"{size:>5} {size * size:>6} | {canvas_start:>10.1f}ms {canvas_reset:>6.2f}ms"
+              f" | {button_start:>11.1f}ms {button_reset:>6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+VecEnv throughput against worker count, and per-step IPC cost against
+observation size (with a do-nothing environment, so only IPC is left).
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from envs import VecEnv
+
+
+class NullEnv:
+    """Does no work; its observation is just a buffer of the requested size."""
+    n_actions = 2
+
+    def __init__(self, obs_size=1, seed=None):
+        self.observation_shape = (obs_size,)
+
+    def reset(self, out=None):
+        return out
+
+    def step(self, action, out=None):
+        return out, 0.0, False, {}
+
+
+def steps_per_second(vec_env, steps):
+    rng = np.random.default_rng(0)
+    vec_env.reset()
+    actions = rng.integers(vec_env.n_actions, size=(steps, vec_env.num_envs))
+    start = time.perf_counter()
+    for step_actions in actions:
+        vec_env.step(step_actions)
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--env", default="snake", choices=["snake", "breakout", "flappy"])
+    parser.add_argument("--envs", type=int, default=32, help="environments per VecEnv")
+    parser.add_argument("--steps", type=int, default=300)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    print(f"{args.env}: {args.envs} envs, {args.steps} steps ({cores} cores)")
+    workers = 1
+    while workers <= min(cores, args.envs):
+        with VecEnv(args.env, args.envs, num_workers=workers, seed=0) as vec_env:
+            rate = steps_per_second(vec_env, args.steps)
+        print(f"  {workers:>3} workers: {rate * args.envs:>10,.0f} env steps/s")
+        workers *= 2
+
+    print("IPC cost per step (NullEnv, 4 workers):")
+    for obs_size in (1, 1_000, 100_000, 1_000_000):
+        with VecEnv(NullEnv, 4, num_workers=4, obs_size=obs_size) as vec_env:
+            rate = steps_per_second(vec_env, 2000)
+        print(f"  obs {obs_size * 4:>10,} bytes/env: {1e6 / rate:>7.1f} us/step")
+
+
+if __name__ == "__main__":
+    main()
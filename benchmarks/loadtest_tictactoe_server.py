@@ -0,0 +1,107 @@
+"""
+Load test for tictactoe_server.py: opens many client pairs that play random
+legal moves against each other and reports moves per second and latency
+percentiles. Starts an in-process server unless --host/--port point elsewhere.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from tick_tack_toe import is_full, winning_line
+from tictactoe_server import MatchServer
+
+
+class LoadClient:
+    """One scripted player; measures MOVE -> MOVED round trips."""
+    def __init__(self, reader, writer, latencies, rng):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+        self.rng = rng
+
+    async def play_games(self, games, size, win_length):
+        for _ in range(games):
+            self.writer.write(f"PLAY {size} {win_length} any\n".encode())
+            await self.writer.drain()
+            mark = None
+            board = [["" for _ in range(size)] for _ in range(size)]
+            turn = "X"
+            finished = False # Decided locally by the same rules, before END arrives
+            sent_at = None
+            while True:
+                if mark is not None and turn == mark and sent_at is None and not finished:
+                    empty = [(r, c) for r in range(size) for c in range(size) if board[r][c] == ""]
+                    r, c = self.rng.choice(empty)
+                    sent_at = time.perf_counter()
+                    self.writer.write(f"MOVE {r} {c}\n".encode())
+                    await self.writer.drain()
+                parts = (await self.reader.readline()).split()
+                if not parts:
+                    return
+                if parts[0] == b"START":
+                    mark = parts[1].decode()
+                elif parts[0] == b"MOVED":
+                    who = parts[1].decode()
+                    r, c = int(parts[2]), int(parts[3])
+                    board[r][c] = who
+                    finished = winning_line(board, who, win_length, (r, c)) is not None or is_full(board)
+                    if who == mark and sent_at is not None:
+                        self.latencies.append(time.perf_counter() - sent_at)
+                        sent_at = None
+                    turn = "O" if who == "X" else "X"
+                elif parts[0] == b"END":
+                    break
+        self.writer.write(b"QUIT\n")
+        await self.writer.drain()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run(args):
+    server = None
+    if args.port == 0:
+        match_server = MatchServer()
+        server = await asyncio.start_server(match_server.handle_client, "127.0.0.1", 0, backlog=4096)
+        host, port = server.sockets[0].getsockname()[:2]
+    else:
+        host, port = args.host, args.port
+
+    latencies = []
+    clients = []
+    for i in range(args.pairs * 2):
+        reader, writer = await asyncio.open_connection(host, port)
+        clients.append(LoadClient(reader, writer, latencies, random.Random(i)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client.play_games(args.games, args.size, args.win_length) for client in clients))
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    print(f"{args.pairs} concurrent games x {args.games} rounds on {args.size}x{args.size}")
+    print(f"moves: {len(latencies)} in {elapsed:.2f}s -> {len(latencies) / elapsed:,.0f} moves/s")
+    if latencies:
+        print(f"latency p50 {percentile(latencies, 0.50) * 1000:.2f}ms"
+              f"  p99 {percentile(latencies, 0.99) * 1000:.2f}ms"
+              f"  max {max(latencies) * 1000:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="0 starts an in-process server")
+    parser.add_argument("--pairs", type=int, default=1000, help="concurrent games")
+    parser.add_argument("--games", type=int, default=3, help="games played by each pair")
+    parser.add_argument("--size", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=3)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
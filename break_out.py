@@ -1,15 +1,24 @@
+import struct
 import tkinter as tk
 import random
 
+import profiling
+import rewind
+from particles import ParticleSystem
+from scene import Scene
+
 # --- Constants ---
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
+BACKGROUND_COLOR = "#2c3e50" # Dark blue
 
 PADDLE_WIDTH = 100
 PADDLE_HEIGHT = 10
 PADDLE_Y_OFFSET = 50 # Distance from the bottom
+PADDLE_COLOR = "#bdc3c7" # Silver
 
 BALL_RADIUS = 10
+BALL_COLOR = "#ecf0f1" # White
 INITIAL_BALL_SPEED_X = 3
 INITIAL_BALL_SPEED_Y = -3 # Start moving upwards
 
@@ -17,7 +26,17 @@ BRICK_ROWS = 5
 BRICK_COLUMNS = 10
 BRICK_WIDTH = WINDOW_WIDTH // BRICK_COLUMNS
 BRICK_HEIGHT = 20
+BRICK_TOP = 50 # Offset of the first row from the top
 BRICK_COLORS = ["#c0392b", "#e67e22", "#f1c40f", "#2ecc71", "#3498db"] # Red, Orange, Yellow, Green, Blue
+BRICK_OUTLINE = "white"
+BRICK_OUTLINE_WIDTH = 2
+
+FRAME_MS = 10
+REWIND_FRAMES = 1000 // FRAME_MS # Backspace rewinds one second (also undoes a game over)
+SAVE_FILE = "breakout.save" # F5 saves, F9 resumes
+# Snapshot layout: ball x1, y1, ball speed x, y, paddle x1, score, lives, then one bit per brick slot.
+# Doubles, so a restore puts back exactly the floats the game was running on
+SNAPSHOT_HEADER = struct.Struct("<5dIB")
 
 # --- Game Class ---
 class BreakoutGame:
@@ -40,9 +59,10 @@ class BreakoutGame:
         self.lives = 3
         self.game_over = False
         self.game_started = False
+        self.loop_running = False
 
         # --- Create Canvas ---
-        self.canvas = tk.Canvas(master, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, bg="#2c3e50") # Dark blue background
+        self.canvas = tk.Canvas(master, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, bg=BACKGROUND_COLOR)
         self.canvas.pack()
 
         # --- Create Game Elements ---
@@ -50,54 +70,66 @@ class BreakoutGame:
         self.create_ball()
         self.create_bricks()
 
-        # --- Display Score and Lives ---
-        self.score_text = self.canvas.create_text(10, 10, text=f"Score: {self.score}", anchor="nw", fill="white", font=("Helvetica", 16))
-        self.lives_text = self.canvas.create_text(WINDOW_WIDTH - 10, 10, text=f"Lives: {self.lives}", anchor="ne", fill="white", font=("Helvetica", 16))
-        
-        # --- Welcome/Instruction Message ---
-        self.start_message = self.canvas.create_text(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2, text="Press Left or Right Arrow to Start", fill="white", font=("Helvetica", 24))
+        # --- Display Score, Lives and Messages ---
+        self.hud = Scene(self.canvas, tag="hud")
+        self.start_message = True # Welcome/instruction message, shown until the first key press
+        self.end_message = None
+        self.update_hud()
+        # Seeded from the game's generator, so a seeded game also repeats its effects
+        self.particles = ParticleSystem(master, self.canvas, tick_ms=FRAME_MS, above=("hud",),
+                                        seed=random.getrandbits(32))
+        self.history = rewind.SnapshotRing(capacity=rewind.REWIND_SECONDS * 1000 // FRAME_MS)
 
 
         # --- Bind Controls ---
         self.master.bind("<Left>", self.move_paddle)
         self.master.bind("<Right>", self.move_paddle)
         self.master.bind("<KeyPress>", self.start_game)
+        self.master.bind("<BackSpace>", lambda event: self.rewind_frames())
+        self.master.bind("<F5>", lambda event: self.save_game())
+        self.master.bind("<F9>", lambda event: self.load_game())
 
 
     def create_paddle(self):
         """Creates the paddle rectangle."""
         x = (WINDOW_WIDTH - PADDLE_WIDTH) / 2
         y = WINDOW_HEIGHT - PADDLE_HEIGHT - PADDLE_Y_OFFSET
-        self.paddle = self.canvas.create_rectangle(x, y, x + PADDLE_WIDTH, y + PADDLE_HEIGHT, fill="#bdc3c7", outline="") # Silver color
+        self.paddle = self.canvas.create_rectangle(x, y, x + PADDLE_WIDTH, y + PADDLE_HEIGHT, fill=PADDLE_COLOR, outline="")
 
     def create_ball(self):
         """Creates the ball oval."""
         x = WINDOW_WIDTH / 2
         y = WINDOW_HEIGHT - PADDLE_HEIGHT - PADDLE_Y_OFFSET - BALL_RADIUS
-        self.ball = self.canvas.create_oval(x - BALL_RADIUS, y - BALL_RADIUS, x + BALL_RADIUS, y + BALL_RADIUS, fill="#ecf0f1", outline="") # White color
+        self.ball = self.canvas.create_oval(x - BALL_RADIUS, y - BALL_RADIUS, x + BALL_RADIUS, y + BALL_RADIUS, fill=BALL_COLOR, outline="")
 
     def create_bricks(self):
         """Creates the grid of bricks."""
         self.bricks = []
+        self.brick_slots = {} # Brick item -> row * BRICK_COLUMNS + col
         for row in range(BRICK_ROWS):
             for col in range(BRICK_COLUMNS):
-                x1 = col * BRICK_WIDTH
-                y1 = row * BRICK_HEIGHT + 50 # Offset from the top
-                x2 = x1 + BRICK_WIDTH
-                y2 = y1 + BRICK_HEIGHT
-                color = BRICK_COLORS[row % len(BRICK_COLORS)]
-                brick = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="white", width=2)
-                self.bricks.append(brick)
+                self.create_brick(row, col)
+
+    def create_brick(self, row, col):
+        x1 = col * BRICK_WIDTH
+        y1 = row * BRICK_HEIGHT + BRICK_TOP
+        x2 = x1 + BRICK_WIDTH
+        y2 = y1 + BRICK_HEIGHT
+        color = BRICK_COLORS[row % len(BRICK_COLORS)]
+        brick = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline=BRICK_OUTLINE, width=BRICK_OUTLINE_WIDTH)
+        self.bricks.append(brick)
+        self.brick_slots[brick] = row * BRICK_COLUMNS + col
 
     def start_game(self, event=None):
         """Starts the game loop when a key is pressed."""
         if not self.game_started and not self.game_over:
             self.game_started = True
-            # Check if the start_message attribute exists and is not None before deleting
-            if hasattr(self, 'start_message') and self.start_message:
-                self.canvas.delete(self.start_message) # Remove the start message
-                self.start_message = None # Set to None to prevent trying to delete it again
-            self.game_loop()
+            if self.start_message:
+                self.start_message = False # Remove the start message
+                self.update_hud()
+            if not self.loop_running: # After a lost life the loop is still going
+                self.loop_running = True
+                self.game_loop()
 
     def move_paddle(self, event):
         """Moves the paddle left or right."""
@@ -120,10 +152,10 @@ class BreakoutGame:
         self.move_ball()
         self.check_collisions()
 
-        if self.lives > 0:
-            self.master.after(10, self.game_loop) # ~100 FPS
-        else:
-            self.end_game("Game Over!")
+        if self.game_over: # check_collisions ends the game when the last life or brick is gone
+            return
+        self.history.push(self.capture_snapshot())
+        self.master.after(FRAME_MS, self.game_loop) # ~100 FPS
 
     def move_ball(self):
         """Moves the ball according to its speed."""
@@ -164,7 +196,10 @@ class BreakoutGame:
         overlapping_items = self.canvas.find_overlapping(x1, y1, x2, y2)
         for item in overlapping_items:
             if item in self.bricks:
+                bx1, by1, bx2, by2 = self.canvas.coords(item)
+                self.particles.emit((bx1 + bx2) / 2, (by1 + by2) / 2, 30, self.canvas.itemcget(item, "fill"))
                 self.bricks.remove(item)
+                del self.brick_slots[item]
                 self.canvas.delete(item)
                 self.ball_speed_y *= -1
                 self.score += 10
@@ -197,21 +232,108 @@ class BreakoutGame:
 
 
     def update_hud(self):
-        """Updates the score and lives display."""
-        self.canvas.itemconfig(self.score_text, text=f"Score: {self.score}")
-        self.canvas.itemconfig(self.lives_text, text=f"Lives: {self.lives}")
+        """Updates the score and lives display and any message on screen."""
+        self.hud.begin()
+        self.hud.text("score", 10, 10, text=f"Score: {self.score}", anchor="nw", fill="white", font=("Helvetica", 16))
+        self.hud.text("lives", WINDOW_WIDTH - 10, 10, text=f"Lives: {self.lives}", anchor="ne", fill="white", font=("Helvetica", 16))
+        if self.start_message:
+            self.hud.text("message", WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2, text="Press Left or Right Arrow to Start", anchor="center", fill="white", font=("Helvetica", 24))
+        if self.end_message:
+            self.hud.text("message", WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2, text=self.end_message, anchor="center", fill="white", font=("Helvetica", 40))
+            self.hud.text("final_score", WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 50, text=f"Final Score: {self.score}", anchor="center", fill="white", font=("Helvetica", 20))
+        self.hud.end()
 
     def end_game(self, message):
         """Ends the game and displays a message."""
         self.game_over = True
+        self.loop_running = False
         self.canvas.delete(self.ball)
         self.canvas.delete(self.paddle)
-        self.canvas.create_text(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2, text=message, fill="white", font=("Helvetica", 40))
-        self.canvas.create_text(WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2 + 50, text=f"Final Score: {self.score}", fill="white", font=("Helvetica", 20))
+        self.end_message = message
+        self.update_hud()
+
+    # --- Snapshots ---
+    def capture_snapshot(self):
+        """Encodes the game as SNAPSHOT_HEADER plus the brick bitmask."""
+        bx, by = self.canvas.coords(self.ball)[:2]
+        px = self.canvas.coords(self.paddle)[0]
+        mask = 0
+        for slot in self.brick_slots.values():
+            mask |= 1 << slot
+        return SNAPSHOT_HEADER.pack(
+            bx, by, self.ball_speed_x, self.ball_speed_y, px, self.score, self.lives
+        ) + mask.to_bytes((BRICK_ROWS * BRICK_COLUMNS + 7) // 8, "little")
+
+    def restore_snapshot(self, snapshot):
+        """Puts the game back to a snapshot, rebuilding the bricks in one pass over the slots."""
+        bx, by, self.ball_speed_x, self.ball_speed_y, px, self.score, self.lives = SNAPSHOT_HEADER.unpack_from(snapshot)
+        mask = int.from_bytes(snapshot[SNAPSHOT_HEADER.size:], "little")
+        if self.game_over:
+            # end_game removed the ball and paddle
+            self.create_paddle()
+            self.create_ball()
+            self.game_over = False
+            self.end_message = None
+
+        py = WINDOW_HEIGHT - PADDLE_HEIGHT - PADDLE_Y_OFFSET
+        self.canvas.coords(self.paddle, px, py, px + PADDLE_WIDTH, py + PADDLE_HEIGHT)
+        self.canvas.coords(self.ball, bx, by, bx + 2 * BALL_RADIUS, by + 2 * BALL_RADIUS)
+
+        items = {slot: item for item, slot in self.brick_slots.items()}
+        self.bricks = []
+        self.brick_slots = {}
+        for slot in range(BRICK_ROWS * BRICK_COLUMNS):
+            item = items.get(slot)
+            if not mask >> slot & 1:
+                if item is not None:
+                    self.canvas.delete(item)
+            elif item is None:
+                self.create_brick(*divmod(slot, BRICK_COLUMNS))
+            else:
+                self.bricks.append(item)
+                self.brick_slots[item] = slot
+
+        if not self.loop_running:
+            # Paused: wait for a key press like at the start
+            self.game_started = False
+            self.start_message = True
+        self.update_hud()
+
+    def rewind_frames(self, frames=REWIND_FRAMES):
+        snapshot = self.history.rewind(frames)
+        if snapshot:
+            self.restore_snapshot(snapshot)
+
+    def save_game(self):
+        if len(self.history):
+            rewind.save_snapshot(SAVE_FILE, "breakout", self.history.get())
+
+    def load_game(self):
+        try:
+            snapshot = rewind.load_snapshot(SAVE_FILE, "breakout")
+        except (OSError, ValueError):
+            return
+        if len(snapshot) != SNAPSHOT_HEADER.size + (BRICK_ROWS * BRICK_COLUMNS + 7) // 8:
+            return
+        self.history.clear()
+        self.history.push(snapshot)
+        self.restore_snapshot(snapshot)
+
+
+def build_window():
+    """Creates the game window. Returns the Tk root."""
+    root = tk.Tk()
+    root.game = BreakoutGame(root)
+    if profiling.enabled():
+        import telemetry
+        telemetry.attach_breakout(root, root.game)
+    return root
+
+
+def main():
+    build_window().mainloop()
 
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    root = tk.Tk()
-    game = BreakoutGame(root)
-    root.mainloop()
+    main()
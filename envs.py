@@ -0,0 +1,347 @@
+"""
+Gym-style environments for Snake, Flappy Horse and Breakout, and a VecEnv
+that runs many of them across worker processes.
+
+The environments run the real game code on the headless toolkit (see
+headless.py), so the rules are exactly the ones players get. Each one has
+reset() -> obs and step(action) -> (obs, reward, done, info) and can
+write its observation into a caller-provided NumPy buffer. PixelEnv swaps
+an environment's observation for a downscaled RGB frame from raster.py.
+
+VecEnv keeps observations, rewards, dones and actions in
+multiprocessing.shared_memory arrays. A step sends each worker a one-byte
+command over a pipe, so the per-step IPC cost does not depend on the
+observation size. NumPy is needed for this module only.
+"""
+import multiprocessing as mp
+import os
+import random
+import types
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import headless
+
+STEP, RESET, CLOSE, DONE = b"s", b"r", b"c", b"k"
+
+
+class SnakeEnv:
+    """Snake on its grid. Actions: 0 up, 1 down, 2 left, 3 right."""
+    ACTIONS = ("up", "down", "left", "right")
+    n_actions = 4
+    observation_dtype = np.float32
+
+    def __init__(self, seed=None):
+        self.game = headless.load_game_module("snake_game")
+        self.game.random = random.Random(seed) # Each env copy gets its own generator
+        self.cols = self.game.GAME_WIDTH // self.game.SPACE_SIZE
+        self.rows = self.game.GAME_HEIGHT // self.game.SPACE_SIZE
+        self.observation_shape = (self.rows, self.cols)
+        self.root = None
+        self.snake = self.food = None # The objects the scheduled next_turn will move
+
+    def observe(self, out=None):
+        """Grid of 0 empty, 1 body, 2 head, 3 food."""
+        if out is None:
+            out = np.zeros(self.observation_shape, dtype=self.observation_dtype)
+        out.fill(0)
+        size = self.game.SPACE_SIZE
+        for x, y in self.snake.coordinates[1:]:
+            if 0 <= x < self.game.GAME_WIDTH and 0 <= y < self.game.GAME_HEIGHT:
+                out[y // size, x // size] = 1
+        x, y = self.snake.coordinates[0]
+        if 0 <= x < self.game.GAME_WIDTH and 0 <= y < self.game.GAME_HEIGHT:
+            out[y // size, x // size] = 2
+        fx, fy = self.food.coordinates
+        out[fy // size, fx // size] = 3
+        return out
+
+    def reset(self, out=None):
+        if self.root is None:
+            self.root = self.game.build_window()
+        else:
+            self.root.scheduled.clear()
+            self.game.restart_game()
+        self.follow_turn()
+        return self.observe(out)
+
+    def follow_turn(self):
+        """
+        Picks up the snake and food from the scheduled next_turn. next_turn
+        carries them as arguments and replaces the food in a local after a
+        meal, so the module's food global only ever holds the first one.
+        """
+        if self.root.scheduled: # Empty after a game over: keep the last turn's objects
+            _, _, _, (self.snake, self.food) = self.root.scheduled[-1]
+
+    def step(self, action, out=None):
+        score = self.game.score
+        self.game.change_direction(self.ACTIONS[action])
+        self.root.run_scheduled()
+        self.follow_turn()
+        done = not self.root.scheduled # next_turn stops rescheduling on game over
+        reward = -1.0 if done else float(self.game.score - score)
+        return self.observe(out), reward, done, {"score": self.game.score}
+
+
+class BreakoutEnv:
+    """Breakout. Actions: 0 stay, 1 left, 2 right."""
+    n_actions = 3
+    observation_dtype = np.float32
+    KEYS = (None, "Left", "Right")
+
+    def __init__(self, seed=None):
+        self.game_module = headless.load_game_module("break_out")
+        self.game_module.random = random.Random(seed)
+        m = self.game_module
+        self.observation_shape = (5 + m.BRICK_ROWS * m.BRICK_COLUMNS,)
+        self.root = m.tk.Tk()
+        self.game = None
+        self.brick_ids = []
+
+    def observe(self, out=None):
+        """Ball position and speed, paddle position, then one flag per brick."""
+        m = self.game_module
+        if out is None:
+            out = np.zeros(self.observation_shape, dtype=self.observation_dtype)
+        canvas = self.game.canvas
+        ball = canvas.coords(self.game.ball) or [0, 0, 0, 0]
+        paddle = canvas.coords(self.game.paddle) or [0, 0, 0, 0]
+        out[0] = ball[0] / m.WINDOW_WIDTH
+        out[1] = ball[1] / m.WINDOW_HEIGHT
+        out[2] = self.game.ball_speed_x / 10
+        out[3] = self.game.ball_speed_y / 10
+        out[4] = paddle[0] / m.WINDOW_WIDTH
+        alive = set(self.game.bricks)
+        out[5:] = [brick in alive for brick in self.brick_ids]
+        return out
+
+    def reset(self, out=None):
+        if self.game is not None:
+            self.game.canvas.destroy()
+        self.root.scheduled.clear()
+        self.game = self.game_module.BreakoutGame(self.root)
+        self.brick_ids = list(self.game.bricks)
+        self.game.start_game()
+        return self.observe(out)
+
+    def step(self, action, out=None):
+        score, lives = self.game.score, self.game.lives
+        if self.KEYS[action]:
+            self.game.move_paddle(types.SimpleNamespace(keysym=self.KEYS[action]))
+        self.root.run_scheduled()
+        reward = (self.game.score - score) / 10 - (lives - self.game.lives)
+        return self.observe(out), float(reward), self.game.game_over, {"score": self.game.score}
+
+
+class FlappyEnv:
+    """Flappy Horse. Actions: 0 glide, 1 jump."""
+    n_actions = 2
+    observation_shape = (5,)
+    observation_dtype = np.float32
+
+    def __init__(self, seed=None):
+        self.game_module = headless.load_game_module("flappyHorse")
+        self.game_module.random = random.Random(seed)
+        self.root = self.game_module.build_window()
+        self.game = self.root.game
+
+    def observe(self, out=None):
+        """Horse height and speed, then the next fence's x and gap edges."""
+        m = self.game_module
+        if out is None:
+            out = np.zeros(self.observation_shape, dtype=self.observation_dtype)
+        out[0] = self.game.horse_y / m.HEIGHT
+        out[1] = self.game.horse_velocity / 10
+        out[2:] = (1.0, 0.0, 1.0)
+        for pipe in self.game.pipes:
+            top = self.game.canvas.coords(pipe["top_main"])
+            if top and top[2] > m.WIDTH / 4:
+                bottom = self.game.canvas.coords(pipe["bottom_main"])
+                out[2:] = (top[0] / m.WIDTH, top[3] / m.HEIGHT, bottom[1] / m.HEIGHT)
+                break
+        return out
+
+    def reset(self, out=None):
+        self.root.scheduled.clear()
+        self.game.start_game()
+        return self.observe(out)
+
+    def step(self, action, out=None):
+        score = self.game.score
+        if action:
+            self.game.jump()
+        self.root.run_scheduled()
+        done = self.game.is_game_over
+        reward = -1.0 if done and self.game.score < 100 else 0.01 + (self.game.score - score)
+        return self.observe(out), float(reward), done, {"score": self.game.score}
+
+
+class PixelEnv:
+    """
+    Any of the environments above, observed as RGB frames drawn by raster.py
+    and averaged down by `scale` (shape: height, width, 3).
+    """
+    RENDERERS = {SnakeEnv: "SnakeRenderer", BreakoutEnv: "BreakoutRenderer", FlappyEnv: "FlappyRenderer"}
+    observation_dtype = np.uint8
+
+    def __init__(self, game, scale=4, seed=None):
+        import raster
+        self.env = make_env(game, seed=seed)
+        self.n_actions = self.env.n_actions
+        self.scale = scale
+        module = self.env.game if isinstance(self.env, SnakeEnv) else self.env.game_module
+        self.renderer = getattr(raster, self.RENDERERS[type(self.env)])(module)
+        self.downscale = raster.downscale
+        height, width = self.renderer.shape[:2]
+        self.observation_shape = (height // scale, width // scale, 3)
+        self.frame = np.empty(self.renderer.shape, dtype=np.uint8)
+
+    def observe(self, out=None):
+        self.renderer.render(self.env.game, out=self.frame)
+        pixels = self.downscale(self.frame, self.scale)
+        if out is None:
+            return pixels
+        out[...] = pixels
+        return out
+
+    def reset(self, out=None):
+        self.env.reset()
+        return self.observe(out)
+
+    def step(self, action, out=None):
+        _, reward, done, info = self.env.step(action)
+        return self.observe(out), reward, done, info
+
+
+ENVS = {"snake": SnakeEnv, "breakout": BreakoutEnv, "flappy": FlappyEnv}
+
+
+def make_env(env, **kwargs):
+    """Builds an environment from its name or class."""
+    return (ENVS[env] if isinstance(env, str) else env)(**kwargs)
+
+
+# --- Vectorized environments ---
+
+def _attach(name, shape, dtype):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _worker(conn, env, env_kwargs, start, stop, seed, layout):
+    """Steps envs[start:stop] and writes results straight into shared memory."""
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in layout.items():
+        block, array = _attach(name, shape, dtype)
+        blocks.append(block)
+        arrays[key] = array
+    obs, rewards, dones, actions = arrays["obs"], arrays["rewards"], arrays["dones"], arrays["actions"]
+    envs = [make_env(env, seed=None if seed is None else seed + i, **env_kwargs) for i in range(start, stop)]
+    try:
+        while True:
+            command = conn.recv_bytes()
+            if command == STEP:
+                for i, e in enumerate(envs, start):
+                    _, reward, done, _ = e.step(int(actions[i]), out=obs[i])
+                    if done:
+                        # Auto-reset, as gym vector envs do; the reward and done flag still report the end
+                        e.reset(out=obs[i])
+                    rewards[i] = reward
+                    dones[i] = done
+            elif command == RESET:
+                for i, e in enumerate(envs, start):
+                    e.reset(out=obs[i])
+                    rewards[i] = 0
+                    dones[i] = False
+            elif command == CLOSE:
+                break
+            conn.send_bytes(DONE)
+    finally:
+        del obs, rewards, dones, actions, arrays
+        for block in blocks:
+            block.close()
+        conn.close()
+
+
+class VecEnv:
+    """
+    Runs num_envs copies of an environment across worker processes.
+    step() and reset() return views of shared buffers that the next call
+    overwrites; copy them if they need to outlive a step. Observations keep
+    the env's observation_dtype (float32 if it has none), so pixels stay uint8.
+    """
+    def __init__(self, env, num_envs, num_workers=None, seed=None, **env_kwargs):
+        probe = make_env(env, **env_kwargs)
+        self.num_envs = num_envs
+        self.n_actions = probe.n_actions
+        self.observation_shape = probe.observation_shape
+        self.observation_dtype = getattr(probe, "observation_dtype", np.float32)
+        num_workers = max(1, min(num_envs, num_workers or os.cpu_count() or 1))
+
+        self.blocks = []
+        layout = {}
+        arrays = {}
+        for key, shape, dtype in (
+            ("obs", (num_envs,) + tuple(self.observation_shape), self.observation_dtype),
+            ("rewards", (num_envs,), np.float32),
+            ("dones", (num_envs,), np.bool_),
+            ("actions", (num_envs,), np.int64),
+        ):
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            self.blocks.append(block)
+            layout[key] = (block.name, shape, dtype)
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self.obs, self.rewards, self.dones, self.actions = (
+            arrays["obs"], arrays["rewards"], arrays["dones"], arrays["actions"]
+        )
+
+        self.conns = []
+        self.processes = []
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            parent, child = mp.Pipe()
+            process = mp.Process(
+                target=_worker, args=(child, env, env_kwargs, int(start), int(stop), seed, layout), daemon=True
+            )
+            process.start()
+            child.close()
+            self.conns.append(parent)
+            self.processes.append(process)
+        self.closed = False
+
+    def _broadcast(self, command):
+        for conn in self.conns:
+            conn.send_bytes(command)
+        for conn in self.conns:
+            conn.recv_bytes()
+
+    def reset(self):
+        self._broadcast(RESET)
+        return self.obs
+
+    def step(self, actions):
+        self.actions[:] = actions
+        self._broadcast(STEP)
+        return self.obs, self.rewards, self.dones, {}
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for conn in self.conns:
+            conn.send_bytes(CLOSE)
+        for process in self.processes:
+            process.join()
+        del self.obs, self.rewards, self.dones, self.actions
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
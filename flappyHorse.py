@@ -1,18 +1,25 @@
 import tkinter as tk
 import random
 
+import profiling
+from particles import ParticleSystem
+from scene import Scene
+
 # --- Game Constants ---
 WIDTH = 400
 HEIGHT = 600
 GRAVITY = 0.4
 JUMP_STRENGTH = -8
 GAME_SPEED = 15  # Lower is faster
+GROUND_HEIGHT = 40
+GRASS_HEIGHT = 10 # Top strip of the ground
 
 # --- Pipe (Fence) Constants ---
 PIPE_WIDTH = 65 # Increased width for texture
 PIPE_GAP = 200
 PIPE_SPEED = -3
 PIPE_SPAWN_RATE = 120 # In game ticks
+FENCE_SHADOW_WIDTH = 5
 
 # --- Scenery Constants ---
 CLOUD_SPEED = -1
@@ -34,6 +41,8 @@ PALETTE = {
 }
 HORSE_EMOJI = "🐴"
 
+_sky_colors = None # Filled in by FlappyHorse.sky_gradient_colors()
+
 class FlappyHorse:
     """The main class for the Flappy Horse game application."""
 
@@ -47,24 +56,29 @@ class FlappyHorse:
         self.canvas.pack()
 
         self.high_score = 0
+        self.modal = Scene(self.canvas, tag="modal")
+        # Seeded from the game's generator, so a seeded game also repeats its effects
+        self.particles = ParticleSystem(root, self.canvas, tick_ms=GAME_SPEED, above=("modal",),
+                                        seed=random.getrandbits(32))
         self.start_screen()
 
     def start_screen(self):
         """Display the initial start screen."""
         self.canvas.delete("all")
+        # Sky and ground never change, so they are drawn once and kept between games
         self.create_sky_gradient()
         self.create_ground()
         self.create_clouds()
         
         # Title with shadow
-        self.canvas.create_text(WIDTH / 2 + 2, HEIGHT / 3 + 2, text="Flappy Horse", font=("Arial", 40, "bold"), fill=PALETTE["text_shadow"], tags="start_text")
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 3, text="Flappy Horse", font=("Arial", 40, "bold"), fill=PALETTE["text"], tags="start_text")
+        self.canvas.create_text(WIDTH / 2 + 2, HEIGHT / 3 + 2, text="Flappy Horse", font=("Arial", 40, "bold"), fill=PALETTE["text_shadow"], tags=("start_text", "playfield"))
+        self.canvas.create_text(WIDTH / 2, HEIGHT / 3, text="Flappy Horse", font=("Arial", 40, "bold"), fill=PALETTE["text"], tags=("start_text", "playfield"))
         
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2, text=HORSE_EMOJI, font=("Arial", 80), tags="start_text")
+        self.canvas.create_text(WIDTH / 2, HEIGHT / 2, text=HORSE_EMOJI, font=("Arial", 80), tags=("start_text", "playfield"))
         
         # Subtext with shadow
-        self.canvas.create_text(WIDTH / 2 + 1, HEIGHT * 2 / 3 + 1, text="Press Space or Click to Start", font=("Arial", 16), fill=PALETTE["text_shadow"], tags="start_text")
-        self.canvas.create_text(WIDTH / 2, HEIGHT * 2 / 3, text="Press Space or Click to Start", font=("Arial", 16), fill=PALETTE["text"], tags="start_text")
+        self.canvas.create_text(WIDTH / 2 + 1, HEIGHT * 2 / 3 + 1, text="Press Space or Click to Start", font=("Arial", 16), fill=PALETTE["text_shadow"], tags=("start_text", "playfield"))
+        self.canvas.create_text(WIDTH / 2, HEIGHT * 2 / 3, text="Press Space or Click to Start", font=("Arial", 16), fill=PALETTE["text"], tags=("start_text", "playfield"))
         
         self.root.bind("<space>", self.start_game)
         self.canvas.bind("<Button-1>", self.start_game)
@@ -74,28 +88,30 @@ class FlappyHorse:
         self.root.unbind("<space>")
         self.canvas.unbind("<Button-1>")
 
-        self.canvas.delete("all")
+        # Clear the last game but keep the backdrop, and hide the end screen for reuse
+        self.canvas.delete("playfield")
+        self.modal.begin()
+        self.modal.end()
+        self.particles.clear()
         self.is_game_over = False
         self.score = 0
 
         # --- Create Scenery ---
-        self.create_sky_gradient()
-        self.create_ground()
         self.create_clouds()
 
         # --- Create Game Objects ---
         # Horse with shadow for depth
         self.horse_y = HEIGHT / 2
         self.horse_velocity = 0
-        self.horse_shadow = self.canvas.create_text(WIDTH / 4 + 2, self.horse_y + 2, text=HORSE_EMOJI, font=("Arial", 30), fill="gray50")
-        self.horse_sprite = self.canvas.create_text(WIDTH / 4, self.horse_y, text=HORSE_EMOJI, font=("Arial", 30))
+        self.horse_shadow = self.canvas.create_text(WIDTH / 4 + 2, self.horse_y + 2, text=HORSE_EMOJI, font=("Arial", 30), fill="gray50", tags="playfield")
+        self.horse_sprite = self.canvas.create_text(WIDTH / 4, self.horse_y, text=HORSE_EMOJI, font=("Arial", 30), tags="playfield")
         
         self.pipes = []
         self.pipe_spawn_counter = PIPE_SPAWN_RATE
         
         # Score display with shadow
-        self.score_shadow = self.canvas.create_text(WIDTH / 2 + 2, 52, text=f"Score: {self.score}", font=("Arial", 24, "bold"), fill=PALETTE["text_shadow"])
-        self.score_text = self.canvas.create_text(WIDTH / 2, 50, text=f"Score: {self.score}", font=("Arial", 24, "bold"), fill=PALETTE["text"])
+        self.score_shadow = self.canvas.create_text(WIDTH / 2 + 2, 52, text=f"Score: {self.score}", font=("Arial", 24, "bold"), fill=PALETTE["text_shadow"], tags="playfield")
+        self.score_text = self.canvas.create_text(WIDTH / 2, 50, text=f"Score: {self.score}", font=("Arial", 24, "bold"), fill=PALETTE["text"], tags="playfield")
 
         # Re-bind jump events
         self.root.bind("<space>", self.jump)
@@ -103,23 +119,30 @@ class FlappyHorse:
 
         self.game_loop()
 
+    def sky_gradient_colors(self):
+        """Computes the sky gradient colors once, the first time the sky is drawn."""
+        global _sky_colors
+        if _sky_colors is None:
+            top_r, top_g, top_b = self.root.winfo_rgb(PALETTE["sky_top"])
+            bot_r, bot_g, bot_b = self.root.winfo_rgb(PALETTE["sky_bottom"])
+            _sky_colors = []
+            for i in range(HEIGHT):
+                # Interpolate color components
+                new_r = int(top_r + (bot_r - top_r) * (i / HEIGHT))
+                new_g = int(top_g + (bot_g - top_g) * (i / HEIGHT))
+                new_b = int(top_b + (bot_b - top_b) * (i / HEIGHT))
+                _sky_colors.append(f'#{new_r:04x}{new_g:04x}{new_b:04x}')
+        return _sky_colors
+
     def create_sky_gradient(self):
         """Creates a vertical gradient for the sky background."""
-        top_r, top_g, top_b = self.root.winfo_rgb(PALETTE["sky_top"])
-        bot_r, bot_g, bot_b = self.root.winfo_rgb(PALETTE["sky_bottom"])
-
-        for i in range(HEIGHT):
-            # Interpolate color components
-            new_r = int(top_r + (bot_r - top_r) * (i / HEIGHT))
-            new_g = int(top_g + (bot_g - top_g) * (i / HEIGHT))
-            new_b = int(top_b + (bot_b - top_b) * (i / HEIGHT))
-            color = f'#{new_r:04x}{new_g:04x}{new_b:04x}'
+        for i, color in enumerate(self.sky_gradient_colors()):
             self.canvas.create_line(0, i, WIDTH, i, fill=color)
 
     def create_ground(self):
         """Creates a multi-layered ground."""
-        self.canvas.create_rectangle(0, HEIGHT - 40, WIDTH, HEIGHT, fill=PALETTE["ground_bottom"], outline="")
-        self.canvas.create_rectangle(0, HEIGHT - 40, WIDTH, HEIGHT - 30, fill=PALETTE["ground_top"], outline="")
+        self.canvas.create_rectangle(0, HEIGHT - GROUND_HEIGHT, WIDTH, HEIGHT, fill=PALETTE["ground_bottom"], outline="")
+        self.canvas.create_rectangle(0, HEIGHT - GROUND_HEIGHT, WIDTH, HEIGHT - GROUND_HEIGHT + GRASS_HEIGHT, fill=PALETTE["ground_top"], outline="")
 
     def create_clouds(self):
         """Create a set of clouds for the background."""
@@ -128,8 +151,8 @@ class FlappyHorse:
             x = random.randint(0, WIDTH)
             y = random.randint(50, HEIGHT // 2)
             size = random.randint(20, 50)
-            cloud_part1 = self.canvas.create_oval(x, y, x + size * 2, y + size, fill=PALETTE["cloud"], outline="")
-            cloud_part2 = self.canvas.create_oval(x + size, y - size / 2, x + size * 3, y + size / 2, fill=PALETTE["cloud"], outline="")
+            cloud_part1 = self.canvas.create_oval(x, y, x + size * 2, y + size, fill=PALETTE["cloud"], outline="", tags="playfield")
+            cloud_part2 = self.canvas.create_oval(x + size, y - size / 2, x + size * 3, y + size / 2, fill=PALETTE["cloud"], outline="", tags="playfield")
             self.clouds.append([cloud_part1, cloud_part2])
 
     def jump(self, event=None):
@@ -207,24 +230,24 @@ class FlappyHorse:
         
         # --- Top Fence ---
         # Main body and shadow for 3D effect
-        top_shadow = self.canvas.create_rectangle(WIDTH, 0, WIDTH + PIPE_WIDTH, top_height, fill=PALETTE["fence_shadow"], outline="")
-        top_main = self.canvas.create_rectangle(WIDTH, 0, WIDTH + PIPE_WIDTH - 5, top_height, fill=PALETTE["fence_main"], outline="")
+        top_shadow = self.canvas.create_rectangle(WIDTH, 0, WIDTH + PIPE_WIDTH, top_height, fill=PALETTE["fence_shadow"], outline="", tags="playfield")
+        top_main = self.canvas.create_rectangle(WIDTH, 0, WIDTH + PIPE_WIDTH - FENCE_SHADOW_WIDTH, top_height, fill=PALETTE["fence_main"], outline="", tags="playfield")
         all_parts.extend([top_shadow, top_main])
         # Wood grain texture
         for _ in range(5):
             line_x = WIDTH + random.randint(5, PIPE_WIDTH - 10)
-            line = self.canvas.create_line(line_x, 0, line_x, top_height, fill=PALETTE["fence_texture"], width=random.randint(1,2))
+            line = self.canvas.create_line(line_x, 0, line_x, top_height, fill=PALETTE["fence_texture"], width=random.randint(1,2), tags="playfield")
             all_parts.append(line)
 
         # --- Bottom Fence ---
         # Main body and shadow
-        bottom_shadow = self.canvas.create_rectangle(WIDTH, bottom_y, WIDTH + PIPE_WIDTH, HEIGHT - 40, fill=PALETTE["fence_shadow"], outline="")
-        bottom_main = self.canvas.create_rectangle(WIDTH, bottom_y, WIDTH + PIPE_WIDTH - 5, HEIGHT - 40, fill=PALETTE["fence_main"], outline="")
+        bottom_shadow = self.canvas.create_rectangle(WIDTH, bottom_y, WIDTH + PIPE_WIDTH, HEIGHT - GROUND_HEIGHT, fill=PALETTE["fence_shadow"], outline="", tags="playfield")
+        bottom_main = self.canvas.create_rectangle(WIDTH, bottom_y, WIDTH + PIPE_WIDTH - FENCE_SHADOW_WIDTH, HEIGHT - GROUND_HEIGHT, fill=PALETTE["fence_main"], outline="", tags="playfield")
         all_parts.extend([bottom_shadow, bottom_main])
         # Wood grain texture
         for _ in range(7):
             line_x = WIDTH + random.randint(5, PIPE_WIDTH - 10)
-            line = self.canvas.create_line(line_x, bottom_y, line_x, HEIGHT - 40, fill=PALETTE["fence_texture"], width=random.randint(1,2))
+            line = self.canvas.create_line(line_x, bottom_y, line_x, HEIGHT - GROUND_HEIGHT, fill=PALETTE["fence_texture"], width=random.randint(1,2), tags="playfield")
             all_parts.append(line)
 
         self.pipes.append({"top_main": top_main, "bottom_main": bottom_main, "parts": all_parts, "scored": False})
@@ -233,7 +256,7 @@ class FlappyHorse:
         """Check for collisions with ground, sky, or fences."""
         horse_coords = self.canvas.bbox(self.horse_sprite)
         
-        if horse_coords[3] >= HEIGHT - 40 or horse_coords[1] < 0:
+        if horse_coords[3] >= HEIGHT - GROUND_HEIGHT or horse_coords[1] < 0:
             self.end_game()
             return
 
@@ -269,6 +292,10 @@ class FlappyHorse:
         self.canvas.unbind("<Button-1>")
 
         self.canvas.itemconfig(self.horse_sprite, fill="red")
+        if not won:
+            # Burst of debris where the horse crashed
+            for color, count in ((PALETTE["fence_main"], 150), (PALETTE["ground_bottom"], 100), ("red", 50)):
+                self.particles.emit(WIDTH / 4, self.horse_y, count, color, speed=5, life=60)
         self.show_end_game_modal(won)
 
     def show_end_game_modal(self, won=False):
@@ -285,29 +312,44 @@ class FlappyHorse:
         else: rank_name, rank_emoji, rank_color = "Brown Horse", "🐴", "#A52A2A"
 
         # Create a wooden sign look
-        self.canvas.create_rectangle(50, HEIGHT/2 - 120, WIDTH-50, HEIGHT/2 + 120, fill=PALETTE["sign_shadow"], outline="")
-        self.canvas.create_rectangle(60, HEIGHT/2 - 110, WIDTH-60, HEIGHT/2 + 110, fill=PALETTE["sign_main"], outline="")
+        modal = self.modal
+        modal.begin()
+        modal.rect("sign_shadow", 50, HEIGHT/2 - 120, WIDTH-50, HEIGHT/2 + 120, fill=PALETTE["sign_shadow"], outline="")
+        modal.rect("sign", 60, HEIGHT/2 - 110, WIDTH-60, HEIGHT/2 + 110, fill=PALETTE["sign_main"], outline="")
         
         # Modal Text with shadows
         title_text = "Victory!" if won else "Game Over"
-        self.canvas.create_text(WIDTH / 2 + 2, HEIGHT / 2 - 88, text=title_text, font=("Arial", 28, "bold"), fill=PALETTE["text_shadow"])
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 90, text=title_text, font=("Arial", 28, "bold"), fill=PALETTE["text"])
+        modal.text("title_shadow", WIDTH / 2 + 2, HEIGHT / 2 - 88, text=title_text, font=("Arial", 28, "bold"), fill=PALETTE["text_shadow"])
+        modal.text("title", WIDTH / 2, HEIGHT / 2 - 90, text=title_text, font=("Arial", 28, "bold"), fill=PALETTE["text"])
         
-        self.canvas.create_text(WIDTH / 2 + 1, HEIGHT / 2 - 49, text=f"Score: {self.score}", font=("Arial", 18), fill=PALETTE["text_shadow"])
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 50, text=f"Score: {self.score}", font=("Arial", 18), fill=PALETTE["text"])
+        modal.text("score_shadow", WIDTH / 2 + 1, HEIGHT / 2 - 49, text=f"Score: {self.score}", font=("Arial", 18), fill=PALETTE["text_shadow"])
+        modal.text("score", WIDTH / 2, HEIGHT / 2 - 50, text=f"Score: {self.score}", font=("Arial", 18), fill=PALETTE["text"])
 
-        self.canvas.create_text(WIDTH / 2 + 1, HEIGHT / 2 - 19, text=f"High Score: {self.high_score}", font=("Arial", 18), fill=PALETTE["text_shadow"])
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 - 20, text=f"High Score: {self.high_score}", font=("Arial", 18), fill=PALETTE["text"])
+        modal.text("high_score_shadow", WIDTH / 2 + 1, HEIGHT / 2 - 19, text=f"High Score: {self.high_score}", font=("Arial", 18), fill=PALETTE["text_shadow"])
+        modal.text("high_score", WIDTH / 2, HEIGHT / 2 - 20, text=f"High Score: {self.high_score}", font=("Arial", 18), fill=PALETTE["text"])
         
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 30, text=f"{rank_emoji} {rank_name} {rank_emoji}", font=("Arial", 20, "bold"), fill=rank_color)
+        modal.text("rank", WIDTH / 2, HEIGHT / 2 + 30, text=f"{rank_emoji} {rank_name} {rank_emoji}", font=("Arial", 20, "bold"), fill=rank_color)
         
-        self.canvas.create_text(WIDTH / 2 + 1, HEIGHT / 2 + 81, text="Press Space to Restart", font=("Arial", 14), fill=PALETTE["text_shadow"])
-        self.canvas.create_text(WIDTH / 2, HEIGHT / 2 + 80, text="Press Space to Restart", font=("Arial", 14), fill=PALETTE["text"])
+        modal.text("restart_shadow", WIDTH / 2 + 1, HEIGHT / 2 + 81, text="Press Space to Restart", font=("Arial", 14), fill=PALETTE["text_shadow"])
+        modal.text("restart", WIDTH / 2, HEIGHT / 2 + 80, text="Press Space to Restart", font=("Arial", 14), fill=PALETTE["text"])
+        modal.end()
         
         self.root.after(500, lambda: self.root.bind("<space>", self.start_game))
 
 
-if __name__ == "__main__":
+def build_window():
+    """Creates the game window. Returns the Tk root."""
     main_window = tk.Tk()
-    game = FlappyHorse(main_window)
-    main_window.mainloop()
+    main_window.game = FlappyHorse(main_window)
+    if profiling.enabled():
+        import telemetry
+        telemetry.attach_flappy(main_window, main_window.game)
+    return main_window
+
+
+def main():
+    build_window().mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Headless stand-ins for the parts of tkinter the games use, so game logic
+can run without a display (benchmarks, bots, training code).
+
+HeadlessCanvas keeps item geometry well enough for coords, bbox and
+find_overlapping to behave like a real Canvas, and counts every call it
+receives. load_game_module() imports a private copy of a game module whose
+`tk` is this fake toolkit instead of tkinter.
+"""
+import importlib.util
+import sys
+import types
+from collections import Counter
+
+# --- Text Metrics ---
+# A rough stand-in for font measurement: pixels per point and glyph width
+# as a fraction of the line height (wide glyphs are emoji).
+POINTS_TO_PIXELS = 4 / 3
+NARROW_GLYPH = 0.6
+WIDE_GLYPH = 1.2
+DEFAULT_FONT_SIZE = 12
+
+NAMED_COLORS = {
+    "white": "#ffffff", "black": "#000000", "red": "#ff0000", "green": "#00ff00",
+    "blue": "#0000ff", "gray50": "#7f7f7f", "gold": "#ffd700", "silver": "#c0c0c0",
+    "cyan": "#00ffff", "yellow": "#ffff00",
+}
+
+
+class TclError(Exception):
+    pass
+
+
+def parse_color(color):
+    """Returns the (r, g, b) bytes of a '#rgb', '#rrggbb', '#rrrrggggbbbb' or named color."""
+    color = NAMED_COLORS.get(color.lower(), color) if not color.startswith("#") else color
+    digits = color[1:]
+    step = len(digits) // 3
+    if step not in (1, 2, 4) or len(digits) != step * 3:
+        raise TclError(f'unknown color name "{color}"')
+    r, g, b = (int(digits[i * step:(i + 1) * step], 16) for i in range(3))
+    scale = {1: 17, 2: 1, 4: 1 / 257}[step]
+    return int(r * scale), int(g * scale), int(b * scale)
+
+
+def _font_size(font):
+    if isinstance(font, HeadlessFont):
+        return font.size
+    if isinstance(font, (tuple, list)) and len(font) > 1:
+        return abs(int(font[1]))
+    return DEFAULT_FONT_SIZE
+
+
+class HeadlessWidget:
+    """Accepts and ignores the calls the games make on ordinary widgets."""
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = dict(options)
+        self.bindings = {}
+
+    def __getattr__(self, name):
+        # Geometry managers, grab_set, transient and friends are no-ops
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def __getitem__(self, key):
+        return self.options.get(key, "")
+
+    def bind(self, sequence, func=None, add=None):
+        self.bindings[sequence] = func
+
+    def unbind(self, sequence, funcid=None):
+        self.bindings.pop(sequence, None)
+
+    def destroy(self):
+        pass
+
+
+class HeadlessRoot(HeadlessWidget):
+    """
+    A root window whose after() calls are queued instead of timed.
+    Drivers decide when scheduled callbacks run, see run_scheduled().
+    """
+    def __init__(self, *args, **options):
+        super().__init__(None, **options)
+        self.scheduled = []
+        self._after_ids = 0
+
+    def after(self, ms, func=None, *args):
+        self._after_ids += 1
+        self.scheduled.append((self._after_ids, ms, func, args))
+        return f"after#{self._after_ids}"
+
+    def after_cancel(self, after_id):
+        number = int(after_id.split("#")[1])
+        self.scheduled = [entry for entry in self.scheduled if entry[0] != number]
+
+    def run_scheduled(self):
+        """Runs every callback scheduled so far; new ones wait for the next call."""
+        pending, self.scheduled = self.scheduled, []
+        for _, _, func, args in pending:
+            func(*args)
+        return len(pending)
+
+    def winfo_rgb(self, color):
+        return tuple(channel * 257 for channel in parse_color(color))
+
+    def winfo_width(self):
+        return 1
+
+    def winfo_height(self):
+        return 1
+
+    def winfo_x(self):
+        return 0
+
+    def winfo_y(self):
+        return 0
+
+    def winfo_screenwidth(self):
+        return 1920
+
+    def winfo_screenheight(self):
+        return 1080
+
+
+class HeadlessCanvas(HeadlessWidget):
+    """A Canvas that tracks item geometry and counts the calls made on it."""
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.calls = Counter()
+        self.items = {} # id -> [type, coords, options, tags]; insertion order is stacking order
+        self._next_id = 1
+
+    # --- Item creation ---
+    def _create(self, kind, coords, options):
+        self.calls["create_" + kind] += 1
+        if len(coords) == 1 and isinstance(coords[0], (tuple, list)):
+            coords = coords[0]
+        tags = options.pop("tags", options.pop("tag", ()))
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = self._next_id
+        self._next_id += 1
+        self.items[item] = [kind, [float(v) for v in coords], options, set(tags)]
+        return item
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options):
+        return self._create("oval", coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def create_window(self, *coords, **options):
+        return self._create("window", coords, options)
+
+    def create_image(self, *coords, **options):
+        return self._create("image", coords, options)
+
+    # --- Item lookup ---
+    def _find(self, tag_or_id):
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, str) and tag_or_id.isdigit():
+            return self._find(int(tag_or_id))
+        return [item for item, entry in self.items.items() if tag_or_id in entry[3]]
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self._find(tag_or_id))
+
+    def type(self, tag_or_id):
+        found = self._find(tag_or_id)
+        return self.items[found[0]][0] if found else None
+
+    def gettags(self, tag_or_id):
+        found = self._find(tag_or_id)
+        return tuple(self.items[found[0]][3]) if found else ()
+
+    # --- Item changes ---
+    def coords(self, tag_or_id, *coords):
+        self.calls["coords"] += 1
+        found = self._find(tag_or_id)
+        if not found:
+            return []
+        if not coords:
+            return list(self.items[found[0]][1])
+        if len(coords) == 1 and isinstance(coords[0], (tuple, list)):
+            coords = coords[0]
+        self.items[found[0]][1] = [float(v) for v in coords]
+
+    def move(self, tag_or_id, dx, dy):
+        self.calls["move"] += 1
+        for item in self._find(tag_or_id):
+            points = self.items[item][1]
+            for i in range(0, len(points), 2):
+                points[i] += dx
+                points[i + 1] += dy
+
+    def moveto(self, tag_or_id, x, y):
+        self.calls["moveto"] += 1
+        for item in self._find(tag_or_id):
+            x1, y1 = self._bbox(item)[:2]
+            points = self.items[item][1]
+            for i in range(0, len(points), 2):
+                points[i] += x - x1
+                points[i + 1] += y - y1
+
+    def itemconfig(self, tag_or_id, **options):
+        self.calls["itemconfig"] += 1
+        for item in self._find(tag_or_id):
+            entry = self.items[item]
+            if "tags" in options:
+                tags = options.pop("tags")
+                entry[3] = {tags} if isinstance(tags, str) else set(tags)
+            entry[2].update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id, option):
+        found = self._find(tag_or_id)
+        return self.items[found[0]][2].get(option, "") if found else ""
+
+    def delete(self, *tags_or_ids):
+        self.calls["delete"] += 1
+        for tag_or_id in tags_or_ids:
+            for item in self._find(tag_or_id):
+                del self.items[item]
+
+    def tag_raise(self, tag_or_id, above=None):
+        self.calls["tag_raise"] += 1
+        for item in self._find(tag_or_id):
+            self.items[item] = self.items.pop(item)
+
+    lift = tag_raise
+
+    def tag_lower(self, tag_or_id, below=None):
+        self.calls["tag_lower"] += 1
+        found = self._find(tag_or_id)
+        rest = {item: entry for item, entry in self.items.items() if item not in found}
+        self.items = {item: self.items[item] for item in found}
+        self.items.update(rest)
+
+    # --- Geometry ---
+    def _bbox(self, item):
+        kind, points, options = self.items[item][:3]
+        if kind == "text":
+            text = str(options.get("text", ""))
+            height = _font_size(options.get("font")) * POINTS_TO_PIXELS
+            width = sum(WIDE_GLYPH if ord(ch) > 0x2000 else NARROW_GLYPH for ch in text) * height
+            x, y = points[0], points[1]
+            anchor = options.get("anchor", "center")
+            x1 = x - width / 2 if anchor in ("center", "n", "s") else (x - width if "e" in anchor else x)
+            y1 = y - height / 2 if anchor in ("center", "e", "w") else (y - height if "s" in anchor else y)
+            return x1, y1, x1 + width, y1 + height
+        xs, ys = points[0::2], points[1::2]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def bbox(self, *tags_or_ids):
+        self.calls["bbox"] += 1
+        boxes = [self._bbox(item) for tag_or_id in tags_or_ids for item in self._find(tag_or_id)
+                 if self.items[item][2].get("state") != "hidden"]
+        if not boxes:
+            return None
+        return (int(min(b[0] for b in boxes)), int(min(b[1] for b in boxes)),
+                int(max(b[2] for b in boxes)) + 1, int(max(b[3] for b in boxes)) + 1)
+
+    def find_overlapping(self, x1, y1, x2, y2):
+        self.calls["find_overlapping"] += 1
+        found = []
+        for item, entry in self.items.items():
+            if entry[2].get("state") == "hidden":
+                continue
+            bx1, by1, bx2, by2 = self._bbox(item)
+            if bx1 <= x2 and bx2 >= x1 and by1 <= y2 and by2 >= y1:
+                found.append(item)
+        return tuple(found)
+
+    def winfo_width(self):
+        return int(self.options.get("width", 1))
+
+    def winfo_height(self):
+        return int(self.options.get("height", 1))
+
+    winfo_reqwidth = winfo_width
+    winfo_reqheight = winfo_height
+
+
+class HeadlessFont:
+    def __init__(self, root=None, family=None, size=DEFAULT_FONT_SIZE, **options):
+        self.family = family
+        self.size = abs(size)
+
+
+def _toolkit():
+    """Builds stand-in `tkinter` and `tkinter.font` modules."""
+    tk = types.ModuleType("tkinter")
+    tk.Tk = HeadlessRoot
+    tk.Canvas = HeadlessCanvas
+    tk.Frame = tk.Label = tk.Button = tk.Toplevel = HeadlessWidget
+    tk.TclError = TclError
+    tk.END = "end"
+    font = types.ModuleType("tkinter.font")
+    font.Font = HeadlessFont
+    tk.font = font
+    return tk, font
+
+
+def load_game_module(name):
+    """
+    Imports a private copy of a game module (e.g. "break_out") built on the
+    headless toolkit. The real module and tkinter are left untouched, and so
+    is anything the game imports for the first time: those modules saw the
+    stand-in toolkit, so they stay private to the copy instead of being
+    cached for later imports.
+    """
+    origin = importlib.util.find_spec(name).origin
+    spec = importlib.util.spec_from_file_location("headless_" + name, origin)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    tk, font = _toolkit()
+    saved = {key: sys.modules.get(key) for key in ("tkinter", "tkinter.font")}
+    before = set(sys.modules)
+    sys.modules["tkinter"], sys.modules["tkinter.font"] = tk, font
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        for key in set(sys.modules) - before:
+            del sys.modules[key]
+        for key, value in saved.items():
+            if value is not None:
+                sys.modules[key] = value
+    return module
@@ -0,0 +1,32 @@
+"""
+Launcher for the games in this directory. Game modules are only imported
+once a game is chosen, so listing them stays instant.
+"""
+import importlib
+import time
+
+# Command name -> (module, title)
+GAMES = {
+    "tictactoe": ("tick_tack_toe", "Tick Tack Toe"),
+    "flappy": ("flappyHorse", "Flappy Horse"),
+    "snake": ("snake_game", "Snake Game"),
+    "breakout": ("break_out", "Breakout"),
+    "arena": ("snake_arena", "Snake Arena"),
+}
+
+
+def load_game(name):
+    """Imports a game module by its command name."""
+    module_name, _ = GAMES[name]
+    return importlib.import_module(module_name)
+
+
+def open_game(name):
+    """
+    Imports a game and builds its window, drawing the first frame.
+    Returns the Tk root and the seconds spent getting there.
+    """
+    start = time.perf_counter()
+    root = load_game(name).build_window()
+    root.update()
+    return root, time.perf_counter() - start
@@ -0,0 +1,73 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+import profiling
+from launcher import GAMES, open_game
+
+
+def choose_game():
+    """Lists the games and asks which one to start."""
+    names = list(GAMES)
+    for number, name in enumerate(names, start=1):
+        print(f"{number}. {GAMES[name][1]} ({name})")
+    choice = input("Choose a game: ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(names):
+        return names[int(choice) - 1]
+    if choice in GAMES:
+        return choice
+    raise SystemExit(f"Unknown game: {choice!r}")
+
+
+def report_cold_starts():
+    """Starts every game in a fresh interpreter and reports time to first frame."""
+    print(f"{'game':<10} {'first frame':>12} {'process':>10}")
+    for name in GAMES:
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "launcher", "--first-frame", name],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            print(f"{name:<10} failed: {result.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{name:<10} {result.stdout.strip():>12} {elapsed * 1000:>8.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m launcher", description="Start one of the games.")
+    parser.add_argument("game", nargs="?", choices=list(GAMES), help="game to start (asks if omitted)")
+    parser.add_argument("--list", action="store_true", help="list the games and exit")
+    parser.add_argument("--first-frame", action="store_true",
+                        help="print the time from import to the first drawn frame and exit")
+    parser.add_argument("--cold-start", action="store_true",
+                        help="report cold-start time to first frame for every game")
+    parser.add_argument("--profile", action="store_true",
+                        help="show the frame telemetry overlay and dump telemetry as JSON lines on exit")
+    args = parser.parse_args()
+
+    if args.profile:
+        os.environ[profiling.ENV_VAR] = "1"
+
+    if args.list:
+        for name, (_, title) in GAMES.items():
+            print(f"{name:<10} {title}")
+        return
+    if args.cold_start:
+        report_cold_starts()
+        return
+
+    name = args.game or choose_game()
+    root, elapsed = open_game(name)
+    if args.first_frame:
+        print(f"{elapsed * 1000:.0f}ms")
+        root.destroy()
+        return
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+A particle system for short visual effects (brick breaks, crashes).
+
+Particles live in fixed-capacity struct-of-arrays storage (array.array),
+dead particles are swap-removed, and emission is capped per frame. Motion
+is ballistic, so a particle's position is computed from its spawn state
+and age when it is drawn instead of being stepped every frame; a frame
+only has to find the particles that expire on it. Only a pooled set of
+canvas items is ever drawn: when more particles are alive than there are
+items, the ones in the first max_items slots are shown. That sample only
+changes when one of its particles dies; a stride over all of them would
+pick different particles every frame and flicker. The system runs its
+own after() loop while particles are alive and stops when they are gone.
+
+    particles = ParticleSystem(root, canvas, tick_ms=10)
+    particles.emit(x, y, 30, "#f1c40f")
+"""
+import math
+import random
+from array import array
+from collections import Counter
+
+CAPACITY = 10000
+SPAWN_BUDGET = 2000 # Particles that may be emitted per frame
+MAX_ITEMS = 300 # Canvas items drawn per frame
+PARTICLE_SIZE = 3
+GRAVITY = 0.15
+TICK_MS = 15
+
+
+class ParticleSystem:
+    """Fixed-capacity particles drawn through a pool of canvas items."""
+    def __init__(self, root, canvas, capacity=CAPACITY, spawn_budget=SPAWN_BUDGET,
+                 max_items=MAX_ITEMS, tick_ms=TICK_MS, gravity=GRAVITY, above=(), rng=None, seed=None):
+        self.root = root
+        self.canvas = canvas
+        self.capacity = capacity
+        self.spawn_budget = spawn_budget
+        self.max_items = max_items
+        self.tick_ms = tick_ms
+        self.gravity = gravity
+        self.above = above # Tags that stay drawn above the particles (an end screen)
+        self.rng = rng or random.Random(seed) # Own generator, so effects never change a game's random sequence
+
+        # --- Struct of arrays ---
+        self.x = array("f", bytes(4 * capacity)) # Spawn position and velocity
+        self.y = array("f", bytes(4 * capacity))
+        self.vx = array("f", bytes(4 * capacity))
+        self.vy = array("f", bytes(4 * capacity))
+        self.born = array("L", [0]) * capacity # Frame numbers
+        self.death = array("L", [0]) * capacity
+        self.color = array("B", bytes(capacity))
+        self.count = 0
+        self.frame = 0
+        self.dying = Counter() # Frame -> particles that expire on it
+
+        self.colors = [] # Color index -> color string
+        self.color_index = {}
+        self.items = [] # Pooled canvas items
+        self.item_colors = []
+        self.visible_items = 0
+        self.spawned_this_frame = 0
+        self.running = False # True while a tick is scheduled
+        self.after_id = None
+
+    def _color(self, color):
+        if color not in self.color_index:
+            self.color_index[color] = len(self.colors)
+            self.colors.append(color)
+        return self.color_index[color]
+
+    def emit(self, x, y, count, color, speed=3.0, life=40):
+        """Emits up to `count` particles from (x, y); returns how many fit in the budget."""
+        count = min(count, self.spawn_budget - self.spawned_this_frame, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        color = self._color(color)
+        rng = self.rng
+        frame = self.frame
+        for i in range(self.count, self.count + count):
+            angle = rng.random() * math.tau
+            velocity = speed * (0.3 + rng.random())
+            lifetime = int(life * (0.5 + rng.random() / 2)) or 1
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = math.cos(angle) * velocity
+            self.vy[i] = math.sin(angle) * velocity
+            self.born[i] = frame
+            self.death[i] = frame + lifetime
+            self.dying[frame + lifetime] += 1
+            self.color[i] = color
+        self.count += count
+        self.spawned_this_frame += count
+        if not self.running:
+            self._schedule()
+        return count
+
+    def update(self):
+        """Advances one frame and swap-removes the particles that expire on it."""
+        self.frame += 1
+        self.spawned_this_frame = 0
+        expiring = self.dying.pop(self.frame, 0)
+        if not expiring:
+            return
+        x, y, vx, vy, born, death, color = self.x, self.y, self.vx, self.vy, self.born, self.death, self.color
+        frame = self.frame
+        count = self.count
+        i = 0
+        for _ in range(expiring):
+            # array.index scans in C; the particle swapped into slot i may expire too, so search from i
+            i = death.index(frame, i, count)
+            count -= 1
+            x[i] = x[count]
+            y[i] = y[count]
+            vx[i] = vx[count]
+            vy[i] = vy[count]
+            born[i] = born[count]
+            death[i] = death[count]
+            color[i] = color[count]
+        self.count = count
+
+    def render(self):
+        """Shows up to max_items particles through the item pool; hides the rest of the pool."""
+        canvas = self.canvas
+        shown = min(self.count, self.max_items)
+        while len(self.items) < shown:
+            self.items.append(canvas.create_rectangle(0, 0, 0, 0, outline="", tags="particles"))
+            self.item_colors.append(-1)
+        size = PARTICLE_SIZE
+        half_gravity = self.gravity / 2
+        for i in range(shown):
+            age = self.frame - self.born[i]
+            # Same path as stepping vy += gravity, then y += vy, once per frame
+            px = self.x[i] + self.vx[i] * age
+            py = self.y[i] + self.vy[i] * age + half_gravity * age * (age + 1)
+            item = self.items[i]
+            canvas.coords(item, px, py, px + size, py + size)
+            if self.item_colors[i] != self.color[i]:
+                self.item_colors[i] = self.color[i]
+                canvas.itemconfig(item, fill=self.colors[self.color[i]], state="normal")
+        for j in range(shown, self.visible_items):
+            canvas.itemconfig(self.items[j], state="hidden")
+            self.item_colors[j] = -1
+        if shown > self.visible_items:
+            canvas.tag_raise("particles")
+            for tag in self.above:
+                canvas.tag_raise(tag)
+        self.visible_items = shown
+
+    # --- Tick Loop ---
+    def _schedule(self):
+        self.running = True
+        self.after_id = self.root.after(self.tick_ms, self.tick)
+
+    def tick(self):
+        self.update()
+        self.render()
+        if self.count:
+            self._schedule()
+        else:
+            self.running = False
+
+    def clear(self):
+        """Drops every particle and stops the tick loop."""
+        if self.running and self.after_id:
+            self.root.after_cancel(self.after_id)
+        self.running = False
+        self.count = 0
+        self.dying.clear()
+        self.spawned_this_frame = 0
+        self.render()
@@ -0,0 +1,13 @@
+"""
+Whether frame telemetry is switched on, without importing telemetry.py.
+
+The games call enabled() in build_window() and only import telemetry when
+it says yes. GAMES_PROFILE unset, empty or "0" means off.
+"""
+import os
+
+ENV_VAR = "GAMES_PROFILE"
+
+
+def enabled():
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
@@ -0,0 +1,208 @@
+"""
+Off-screen rendering of Snake, Breakout and Flappy Horse into NumPy RGB frames.
+
+A renderer reads a running game's state (the same objects and canvas
+coordinates the game itself uses) and draws it with the games' own
+constants (SPACE_SIZE and the snake colours, BRICK_COLORS, PALETTE) into
+a (height, width, 3) uint8 array. No Tk window is needed: the games can
+run on the headless toolkit (see headless.py). Only what matters for
+play is drawn. Text, particles and the fences' wood grain are left out,
+and Flappy Horse's horse is drawn as its hitbox.
+
+    renderer = raster.SnakeRenderer(snake_module)
+    frame = renderer.render(snake_module) # Breakout and Flappy Horse take the game object
+    small = raster.downscale(frame, 4) # Block mean, for pixel observations
+    with raster.VideoWriter("snake.rgb", frame.shape, fps=10) as video:
+        video.write(frame)
+
+NumPy is needed for this module only.
+"""
+import numpy as np
+
+from headless import parse_color
+
+HORSE_HITBOX_COLOR = "#A52A2A" # Brown, as the horse's lowest rank
+
+
+def rgb(color):
+    return np.array(parse_color(color), dtype=np.uint8)
+
+
+def _clip(frame, x1, y1, x2, y2):
+    height, width = frame.shape[:2]
+    return (max(0, int(round(x1))), max(0, int(round(y1))),
+            min(width, int(round(x2))), min(height, int(round(y2))))
+
+
+def fill_rect(frame, x1, y1, x2, y2, color):
+    """Fills [x1, x2) x [y1, y2), clipped to the frame."""
+    x1, y1, x2, y2 = _clip(frame, x1, y1, x2, y2)
+    if x1 < x2 and y1 < y2:
+        frame[y1:y2, x1:x2] = color
+
+
+def fill_oval(frame, x1, y1, x2, y2, color):
+    """Fills the ellipse inscribed in a box, clipped to the frame."""
+    cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+    rx, ry = max((x2 - x1) / 2, 0.5), max((y2 - y1) / 2, 0.5)
+    x1, y1, x2, y2 = _clip(frame, x1, y1, x2, y2)
+    if x1 >= x2 or y1 >= y2:
+        return
+    ys = (np.arange(y1, y2) + 0.5 - cy) / ry
+    xs = (np.arange(x1, x2) + 0.5 - cx) / rx
+    inside = ys[:, None] ** 2 + xs[None, :] ** 2 <= 1
+    frame[y1:y2, x1:x2][inside] = color
+
+
+def downscale(frame, factor, out=None):
+    """Averages factor x factor blocks; edges that do not fill a block are dropped."""
+    height, width = frame.shape[0] // factor, frame.shape[1] // factor
+    frame = frame[:height * factor, :width * factor]
+    dtype = np.uint16 if factor * factor * 255 <= 0xFFFF else np.uint32
+    # Summing strided rows, then strided columns, runs as whole-array adds
+    # (several times faster than summing a 5-d block view)
+    rows = frame[0::factor].astype(dtype)
+    for i in range(1, factor):
+        rows += frame[i::factor]
+    total = rows[:, 0::factor].copy()
+    for i in range(1, factor):
+        total += rows[:, i::factor]
+    total //= factor * factor
+    if out is None:
+        out = np.empty((height, width, 3), dtype=np.uint8)
+    out[...] = total
+    return out
+
+
+class Renderer:
+    """Base for the per-game renderers: keeps the static background and copies it in each frame."""
+    def __init__(self, width, height):
+        self.shape = (height, width, 3)
+        self.background = np.zeros(self.shape, dtype=np.uint8)
+
+    def new_frame(self, out):
+        if out is None:
+            out = np.empty(self.shape, dtype=np.uint8)
+        np.copyto(out, self.background)
+        return out
+
+
+class SnakeRenderer(Renderer):
+    """Draws snake_game: the snake's squares and the food."""
+    def __init__(self, module):
+        super().__init__(module.GAME_WIDTH, module.GAME_HEIGHT)
+        self.background[:] = rgb(module.BACKGROUND_COLOR)
+        self.snake_color = rgb(module.SNAKE_COLOR)
+        self.food_color = rgb(module.FOOD_COLOR)
+
+    def render(self, module, out=None):
+        frame = self.new_frame(out)
+        size = module.SPACE_SIZE
+        # live_snake/live_food are the objects the game loop moves (set every turn)
+        snake = module.live_snake or module.snake
+        food = module.live_food or module.food
+        fx, fy = food.coordinates
+        fill_oval(frame, fx, fy, fx + size, fy + size, self.food_color)
+        for x, y in snake.coordinates:
+            fill_rect(frame, x, y, x + size, y + size, self.snake_color)
+        return frame
+
+
+class BreakoutRenderer(Renderer):
+    """Draws a break_out.BreakoutGame: bricks with their outline, paddle and ball."""
+    def __init__(self, module):
+        super().__init__(module.WINDOW_WIDTH, module.WINDOW_HEIGHT)
+        self.module = module
+        self.background[:] = rgb(module.BACKGROUND_COLOR)
+        self.brick_colors = [rgb(color) for color in module.BRICK_COLORS]
+        self.outline = rgb(module.BRICK_OUTLINE)
+        self.paddle_color = rgb(module.PADDLE_COLOR)
+        self.ball_color = rgb(module.BALL_COLOR)
+
+    def render(self, game, out=None):
+        m = self.module
+        frame = self.new_frame(out)
+        half = m.BRICK_OUTLINE_WIDTH / 2 # Tk centres outlines on the edge
+        for slot in game.brick_slots.values():
+            row, col = divmod(slot, m.BRICK_COLUMNS)
+            x1, y1 = col * m.BRICK_WIDTH, row * m.BRICK_HEIGHT + m.BRICK_TOP
+            x2, y2 = x1 + m.BRICK_WIDTH, y1 + m.BRICK_HEIGHT
+            fill_rect(frame, x1 - half, y1 - half, x2 + half, y2 + half, self.outline)
+            fill_rect(frame, x1 + half, y1 + half, x2 - half, y2 - half, self.brick_colors[row % len(self.brick_colors)])
+        if not game.game_over: # end_game deletes the paddle and ball
+            fill_rect(frame, *game.canvas.coords(game.paddle), self.paddle_color)
+            fill_oval(frame, *game.canvas.coords(game.ball), self.ball_color)
+        return frame
+
+
+class FlappyRenderer(Renderer):
+    """Draws a flappyHorse.FlappyHorse: sky, ground, clouds, fences and the horse's hitbox."""
+    def __init__(self, module):
+        super().__init__(module.WIDTH, module.HEIGHT)
+        self.module = module
+        palette = module.PALETTE
+        # The sky gradient, interpolated per row as FlappyHorse.sky_gradient_colors() does
+        top, bottom = rgb(palette["sky_top"]).astype(np.float64), rgb(palette["sky_bottom"]).astype(np.float64)
+        rows = np.arange(module.HEIGHT)[:, None] / module.HEIGHT
+        self.background[:] = (top + (bottom - top) * rows).astype(np.uint8)[:, None, :]
+        ground = module.HEIGHT - module.GROUND_HEIGHT
+        fill_rect(self.background, 0, ground, module.WIDTH, module.HEIGHT, rgb(palette["ground_bottom"]))
+        fill_rect(self.background, 0, ground, module.WIDTH, ground + module.GRASS_HEIGHT, rgb(palette["ground_top"]))
+        self.cloud_color = rgb(palette["cloud"])
+        self.fence_color = rgb(palette["fence_main"])
+        self.shadow_color = rgb(palette["fence_shadow"])
+        self.horse_color = rgb(HORSE_HITBOX_COLOR)
+
+    def render(self, game, out=None):
+        m = self.module
+        frame = self.new_frame(out)
+        canvas = game.canvas
+        for cloud in getattr(game, "clouds", ()):
+            for part in cloud:
+                coords = canvas.coords(part)
+                if coords:
+                    fill_oval(frame, *coords, self.cloud_color)
+        for pipe in getattr(game, "pipes", ()):
+            for key in ("top_main", "bottom_main"):
+                coords = canvas.coords(pipe[key])
+                if coords:
+                    x1, y1, x2, y2 = coords
+                    fill_rect(frame, x1, y1, x2 + m.FENCE_SHADOW_WIDTH, y2, self.shadow_color)
+                    fill_rect(frame, x1, y1, x2, y2, self.fence_color)
+        horse = canvas.bbox(game.horse_sprite) if hasattr(game, "horse_sprite") else None
+        if horse:
+            fill_rect(frame, *horse, self.horse_color)
+        return frame
+
+
+class VideoWriter:
+    """
+    Streams frames to a raw rgb24 file (no header, frames back to back).
+    command() gives the ffmpeg line that turns it into a normal video.
+    """
+    def __init__(self, path, shape, fps):
+        self.path = path
+        self.shape = tuple(shape)
+        self.fps = fps
+        self.frames = 0
+        self.file = open(path, "wb")
+
+    def write(self, frame):
+        if frame.shape != self.shape or frame.dtype != np.uint8:
+            raise ValueError(f"expected a {self.shape} uint8 frame, got {frame.shape} {frame.dtype}")
+        self.file.write(np.ascontiguousarray(frame).data)
+        self.frames += 1
+
+    def command(self, output="out.mp4"):
+        height, width = self.shape[:2]
+        return (f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {self.fps} "
+                f"-i {self.path} -pix_fmt yuv420p {output}")
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
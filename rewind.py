@@ -0,0 +1,146 @@
+"""
+Rewind history and save files for game snapshots.
+
+A game encodes its state as a fixed-layout byte string (see the snapshot
+sections of snake_game.py and break_out.py) and pushes one per frame into a
+SnapshotRing. The ring keeps a full keyframe every KEYFRAME_EVERY frames;
+the frames in between are stored as the byte spans that differ from their
+keyframe. Since the layouts are fixed, most bytes stay put from frame to
+frame and a delta is a few bytes. Rebuilding any frame is one copy of its
+keyframe plus one delta, so it costs O(snapshot size). The ring is bounded:
+whole keyframe groups are dropped from the old end once it holds more than
+`capacity` frames.
+
+    history = SnapshotRing(capacity=500)
+    history.push(snapshot)
+    snapshot = history.rewind(100) # The frame 100 pushes back; newer ones are dropped
+"""
+import struct
+from collections import deque
+
+KEYFRAME_EVERY = 32
+REWIND_SECONDS = 5 # How much history the games keep
+SPAN = struct.Struct("<HH") # offset, length of a changed span; snapshots stay under 64 KiB
+SPAN_MERGE_GAP = SPAN.size # Unchanged runs shorter than a span header are cheaper to resend
+DIFF_BLOCK = 64
+SAVE_MAGIC = b"PGSV"
+SAVE_HEADER = struct.Struct("<4s8sI") # magic, game name, snapshot length
+
+
+def diff(base, snapshot):
+    """Encodes snapshot as the spans where it differs from base (same length)."""
+    out = bytearray()
+    start = None # Start of the open span
+    last = None # Last differing byte of the open span
+    for block in range(0, len(snapshot), DIFF_BLOCK):
+        end = block + DIFF_BLOCK
+        if base[block:end] == snapshot[block:end]:
+            continue # Whole blocks compare in C; only blocks that differ are walked byte by byte
+        for i in range(block, min(end, len(snapshot))):
+            if base[i] == snapshot[i]:
+                continue
+            if start is not None and i - last > SPAN_MERGE_GAP:
+                out += SPAN.pack(start, last + 1 - start) + snapshot[start:last + 1]
+                start = None
+            if start is None:
+                start = i
+            last = i
+    if start is not None:
+        out += SPAN.pack(start, last + 1 - start) + snapshot[start:last + 1]
+    return bytes(out)
+
+
+def patch(base, delta):
+    """Applies a diff() result to a copy of base."""
+    out = bytearray(base)
+    i = 0
+    while i < len(delta):
+        offset, length = SPAN.unpack_from(delta, i)
+        i += SPAN.size
+        out[offset:offset + length] = delta[i:i + length]
+        i += length
+    return bytes(out)
+
+
+class SnapshotRing:
+    """A bounded history of fixed-layout snapshots, delta-encoded against keyframes."""
+    def __init__(self, capacity, keyframe_every=KEYFRAME_EVERY):
+        self.capacity = capacity
+        self.keyframe_every = keyframe_every
+        self.groups = deque() # [keyframe, [delta, ...]] per keyframe
+        self.frames = 0
+
+    def __len__(self):
+        return self.frames
+
+    def push(self, snapshot):
+        if len(snapshot) > 0xFFFF:
+            raise ValueError("snapshots are limited to 64 KiB")
+        last = self.groups[-1] if self.groups else None
+        if last is None or len(last[1]) + 1 >= self.keyframe_every or len(last[0]) != len(snapshot):
+            self.groups.append([bytes(snapshot), []])
+        else:
+            last[1].append(diff(last[0], snapshot))
+        self.frames += 1
+        while self.frames - (1 + len(self.groups[0][1])) >= self.capacity:
+            self.frames -= 1 + len(self.groups.popleft()[1])
+
+    def get(self, back=0):
+        """Rebuilds the snapshot pushed `back` frames before the newest one."""
+        if not 0 <= back < self.frames:
+            raise IndexError("snapshot out of range")
+        for keyframe, deltas in reversed(self.groups):
+            size = 1 + len(deltas)
+            if back < size:
+                index = size - 1 - back
+                return keyframe if index == 0 else patch(keyframe, deltas[index - 1])
+            back -= size
+
+    def rewind(self, frames):
+        """
+        Returns the snapshot `frames` pushes back (or the oldest one kept) and
+        drops everything newer, so the game records on from it.
+        """
+        if not self.frames:
+            return None
+        back = min(frames, self.frames - 1)
+        snapshot = self.get(back)
+        for _ in range(back):
+            keyframe, deltas = self.groups[-1]
+            if deltas:
+                deltas.pop()
+            else:
+                self.groups.pop()
+            self.frames -= 1
+        return snapshot
+
+    def clear(self):
+        self.groups.clear()
+        self.frames = 0
+
+    def nbytes(self):
+        """Bytes held by the stored keyframes and deltas."""
+        return sum(len(keyframe) + sum(map(len, deltas)) for keyframe, deltas in self.groups)
+
+
+# --- Save Files ---
+
+def save_snapshot(path, game, snapshot):
+    with open(path, "wb") as out:
+        out.write(SAVE_HEADER.pack(SAVE_MAGIC, game.encode(), len(snapshot)))
+        out.write(snapshot)
+
+
+def load_snapshot(path, game):
+    """Reads a save_snapshot() file; raises ValueError if it is not a save of this game."""
+    with open(path, "rb") as saved:
+        data = saved.read()
+    if len(data) < SAVE_HEADER.size:
+        raise ValueError(f"{path} is not a save file")
+    magic, name, length = SAVE_HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC or name.rstrip(b"\0") != game.encode():
+        raise ValueError(f"{path} is not a {game} save file")
+    snapshot = data[SAVE_HEADER.size:]
+    if len(snapshot) != length:
+        raise ValueError(f"{path} is truncated")
+    return snapshot
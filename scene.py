@@ -0,0 +1,151 @@
+"""
+A small retained-mode layer over a Tk Canvas.
+
+Each frame a game declares what should be on screen, keyed by any hashable:
+
+    scene.begin()
+    scene.rect(("snake", x, y), x, y, x + 25, y + 25, fill="#00FF00")
+    scene.text("score", 10, 10, text="Score: 3", anchor="nw")
+    scene.end()
+
+end() diffs the declarations against the previous frame and issues only the
+canvas calls that changed. Items that disappear are recycled: first for
+items of the same type that appear in the same frame (a snake's tail square
+simply moves to the new head), then through hidden items, which keep their
+key so that a returning item (an end screen shown again) only needs to be
+shown. A scene behaves as a layer: when hidden items come back the whole
+scene is raised above the rest of the canvas. A recycled item keeps options
+it was not given again, so items of one kind should be declared with the
+same set of options.
+"""
+
+HIDDEN = "hidden"
+
+
+class Scene:
+    """Keyed canvas items diffed frame to frame."""
+    def __init__(self, canvas, tag="scene"):
+        self.canvas = canvas
+        self.tag = tag
+        self.items = {} # key -> [kind, item id, coords, options]
+        self.hidden = {} # kind -> {key: entry} for items hidden but kept for reuse
+        self.declared = {}
+        # --- Stats ---
+        self.frames = 0
+        self.ops = 0
+        self.naive_ops = 0
+        self.last_ops = 0
+        self.last_saved = 0
+
+    # --- Declarations ---
+    def begin(self):
+        self.declared = {}
+
+    def _declare(self, kind, key, coords, options):
+        self.declared[key] = (kind, tuple(coords), options)
+
+    def rect(self, key, *coords, **options):
+        self._declare("rectangle", key, coords, options)
+
+    def oval(self, key, *coords, **options):
+        self._declare("oval", key, coords, options)
+
+    def line(self, key, *coords, **options):
+        self._declare("line", key, coords, options)
+
+    def text(self, key, *coords, **options):
+        self._declare("text", key, coords, options)
+
+    # --- Diffing ---
+    def _update(self, entry, coords, options, extra=None):
+        """Brings an existing item to the declared coords and options."""
+        ops = 0
+        if entry[2] != coords:
+            self.canvas.coords(entry[1], *coords)
+            entry[2] = coords
+            ops += 1
+        changed = {name: value for name, value in options.items() if entry[3].get(name) != value}
+        if extra:
+            changed.update(extra)
+        if changed:
+            self.canvas.itemconfig(entry[1], **changed)
+            entry[3].update(changed)
+            ops += 1
+        return ops
+
+    def end(self):
+        """Applies this frame's declarations. Returns the number of canvas calls issued."""
+        ops = 0
+        arrivals = []
+        for key, (kind, coords, options) in self.declared.items():
+            entry = self.items.get(key)
+            if entry is not None and entry[0] == kind:
+                ops += self._update(entry, coords, options)
+            else:
+                arrivals.append(key)
+
+        departures = {}
+        replaced = set(arrivals)
+        for key in [key for key in self.items if key not in self.declared or key in replaced]:
+            entry = self.items.pop(key)
+            departures.setdefault(entry[0], []).append((key, entry))
+
+        shown = False
+        for key in arrivals:
+            kind, coords, options = self.declared[key]
+            hidden = self.hidden.get(kind)
+            if hidden and key in hidden:
+                # The same item was hidden earlier: show it again
+                entry = hidden.pop(key)
+                ops += self._update(entry, coords, options, extra={"state": "normal"})
+                shown = True
+            elif departures.get(kind):
+                # Reuse an item that left this frame: it is already visible
+                entry = departures[kind].pop()[1]
+                ops += self._update(entry, coords, options)
+            elif hidden:
+                entry = hidden.pop(next(iter(hidden)))
+                ops += self._update(entry, coords, options, extra={"state": "normal"})
+                shown = True
+            else:
+                item = getattr(self.canvas, "create_" + kind)(*coords, tags=self.tag, **options)
+                entry = [kind, item, coords, dict(options)]
+                ops += 1
+            self.items[key] = entry
+
+        for kind, leftovers in departures.items():
+            for key, entry in leftovers:
+                self.canvas.itemconfig(entry[1], state=HIDDEN)
+                entry[3]["state"] = HIDDEN
+                self.hidden.setdefault(kind, {})[key] = entry
+                ops += 1
+
+        if shown:
+            self.canvas.tag_raise(self.tag)
+            ops += 1
+
+        # Redrawing from scratch would delete the old items (one call by tag)
+        # and create every declared item again.
+        naive = len(self.declared) + 1
+        self.frames += 1
+        self.ops += ops
+        self.naive_ops += naive
+        self.last_ops = ops
+        self.last_saved = naive - ops
+        return ops
+
+    def clear(self):
+        """Deletes every item of the scene, visible or hidden."""
+        self.canvas.delete(self.tag)
+        self.items = {}
+        self.hidden = {}
+
+    def stats(self):
+        frames = self.frames or 1
+        return {
+            "frames": self.frames,
+            "ops_per_frame": self.ops / frames,
+            "naive_ops_per_frame": self.naive_ops / frames,
+            "ops_saved_per_frame": (self.naive_ops - self.ops) / frames,
+            "hidden_items": sum(len(items) for items in self.hidden.values()),
+        }
@@ -0,0 +1,303 @@
+"""
+Self-play data for tic-tac-toe and its larger boards.
+
+Producer processes play engine-vs-engine games headless with the real rules
+(winning_line from tick_tack_toe.py) and turn every position into a
+(position, move, outcome) record:
+- position: the board before the move, 2 bits per cell (0 empty, 1 X, 2 O)
+- move: the cell played, as row * size + col
+- outcome: +1 if the player to move went on to win, -1 if they lost, 0 for a draw
+
+Positions are stored in canonical form, the smallest of the board's eight
+rotations and reflections, with the move mapped along. The parent process
+drops repeated positions with a fixed-size Bloom filter, so memory stays
+bounded however long it runs (a false positive occasionally drops a new
+position too). Records are written in chunks; read_records() streams them
+back lazily.
+
+File layout: FILE_HEADER, then chunks of CHUNK_HEADER (record count, CRC32)
+followed by the records, each position bytes + move (uint16) + outcome (int8).
+
+    python selfplay.py --size 9 --win-length 5 --games 20000 --out selfplay.bin
+"""
+import argparse
+import hashlib
+import multiprocessing as mp
+import os
+import random
+import struct
+import time
+import zlib
+from array import array
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+
+from tick_tack_toe import BOARD_SIZE, winning_line
+from tictactoe_server import greedy_move
+
+FILE_MAGIC = b"TTTS"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBBBH") # magic, version, board size, win length, record size
+CHUNK_HEADER = struct.Struct("<II") # records in the chunk, CRC32 of the records
+MOVE_OUTCOME = struct.Struct("<Hb")
+CHUNK_RECORDS = 4096
+GAMES_PER_JOB = 50
+JOBS_PER_WORKER = 4 # Jobs queued or running per worker, so results never pile up unread
+BLOOM_BITS = 1 << 27 # 16 MiB
+BLOOM_HASHES = 4
+MARKS = ("", "X", "O")
+
+
+def random_move(board, mark, win_length=None, rng=random):
+    """Plays any empty cell."""
+    return rng.choice([(r, c) for r, row in enumerate(board) for c, cell in enumerate(row) if cell == ""])
+
+
+ENGINES = {"random": random_move, "greedy": greedy_move}
+
+
+# --- Games ---
+
+def play_games(size, win_length, engines, rng):
+    """Endlessly yields finished games as (moves, winner); winner is "X", "O" or "" for a draw."""
+    x_engine, o_engine = (ENGINES[name] for name in engines)
+    while True:
+        board = [["" for _ in range(size)] for _ in range(size)]
+        moves = []
+        winner = ""
+        mark = "X"
+        for _ in range(size * size):
+            r, c = (x_engine if mark == "X" else o_engine)(board, mark, win_length, rng)
+            board[r][c] = mark
+            moves.append(r * size + c)
+            if winning_line(board, mark, win_length, (r, c)) is not None:
+                winner = mark
+                break
+            mark = "O" if mark == "X" else "X"
+        yield moves, winner
+
+
+def game_records(size, moves, winner):
+    """Yields (cells, move, outcome) for each position of a game; cells is a bytes of 0/1/2 per cell."""
+    cells = bytearray(size * size)
+    for ply, move in enumerate(moves):
+        mark = 1 + ply % 2
+        outcome = 0 if not winner else (1 if MARKS[mark] == winner else -1)
+        yield bytes(cells), move, outcome
+        cells[move] = mark
+
+
+# --- Canonical Form ---
+
+def symmetries(size):
+    """The eight rotations/reflections as (getter, inverse): getter(cells) is the transformed board."""
+    transforms = []
+    for flip in (False, True):
+        for turns in range(4):
+            perm = []
+            for r in range(size):
+                for c in range(size):
+                    rr, cc = r, c
+                    for _ in range(turns):
+                        rr, cc = cc, size - 1 - rr
+                    if flip:
+                        cc = size - 1 - cc
+                    perm.append(rr * size + cc)
+            inverse = [0] * len(perm)
+            for j, i in enumerate(perm):
+                inverse[i] = j
+            transforms.append((itemgetter(*perm), inverse))
+    return transforms
+
+
+def pack_cells(cells):
+    """Packs 0/1/2 cells four to a byte."""
+    cells = bytes(cells) + bytes(-len(cells) % 4)
+    return bytes(a | b << 2 | c << 4 | d << 6 for a, b, c, d in zip(cells[0::4], cells[1::4], cells[2::4], cells[3::4]))
+
+
+def canonical(cells, move, transforms):
+    """Returns the smallest symmetric form of the position and the move mapped into it."""
+    best = None
+    for getter, inverse in transforms:
+        candidate = bytes(getter(cells))
+        if best is None or candidate < best:
+            best, best_move = candidate, inverse[move]
+    return best, best_move
+
+
+# --- Producers ---
+
+def _produce(job):
+    """Plays one batch of games; returns (hashes as uint64 bytes, packed records)."""
+    size, win_length, engines, seed, index, games = job
+    transforms = symmetries(size)
+    hashes = array("Q")
+    records = bytearray()
+    # A string seed is hashed whole, so (seed, index) pairs never share a stream the
+    # way seed + index would (seed 0's job 1 would be seed 1's job 0)
+    stream = play_games(size, win_length, engines, random.Random(f"{seed}/{index}"))
+    for _ in range(games):
+        moves, winner = next(stream)
+        for cells, move, outcome in game_records(size, moves, winner):
+            position, move = canonical(cells, move, transforms)
+            hashes.append(int.from_bytes(hashlib.blake2b(position, digest_size=8).digest(), "little"))
+            records += pack_cells(position) + MOVE_OUTCOME.pack(move, outcome)
+    return hashes.tobytes(), bytes(records)
+
+
+def produce(size, win_length, engines, games, workers=None, seed=0):
+    """Yields (hash, record) for every position of `games` games, from `workers` processes."""
+    workers = workers or os.cpu_count() or 1
+    record_size = record_size_for(size)
+    jobs = (
+        (size, win_length, engines, seed, index, min(GAMES_PER_JOB, games - start))
+        for index, start in enumerate(range(0, games, GAMES_PER_JOB))
+    )
+    if workers == 1:
+        batches = map(_produce, jobs)
+        pool = None
+    else:
+        pool = mp.Pool(workers)
+        batches = _bounded(pool, jobs, JOBS_PER_WORKER * workers)
+    try:
+        for hashes, records in batches:
+            for i, key in enumerate(array("Q", hashes)):
+                yield key, records[i * record_size:(i + 1) * record_size]
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def _bounded(pool, jobs, limit):
+    """
+    Yields _produce(job) for each job, in order, keeping at most `limit` jobs
+    submitted to the pool. Pool.imap would run ahead of a slow consumer and
+    buffer every finished batch in the parent.
+    """
+    pending = deque(pool.apply_async(_produce, (job,)) for job in islice(jobs, limit))
+    while pending:
+        batch = pending.popleft().get()
+        for job in islice(jobs, 1):
+            pending.append(pool.apply_async(_produce, (job,)))
+        yield batch
+
+
+class BloomFilter:
+    """A fixed-size set of 64-bit hashes that may report false positives."""
+    def __init__(self, bits=BLOOM_BITS, hashes=BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self.table = bytearray(bits // 8)
+
+    def add(self, key):
+        """Adds a hash; returns False if it was (probably) there already."""
+        low, high = key & 0xFFFFFFFF, (key >> 32) | 1
+        new = False
+        for i in range(self.hashes):
+            bit = (low + i * high) % self.bits
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if not self.table[byte] & mask:
+                self.table[byte] |= mask
+                new = True
+        return new
+
+
+def dedupe(stream, bloom=None):
+    """Passes on the records of positions not seen before."""
+    bloom = bloom or BloomFilter()
+    for key, record in stream:
+        if bloom.add(key):
+            yield record
+
+
+# --- Record Files ---
+
+def record_size_for(size):
+    return (size * size + 3) // 4 + MOVE_OUTCOME.size
+
+
+def write_records(path, size, win_length, records):
+    """Writes packed records in chunks of CHUNK_RECORDS; returns how many were written."""
+    record_size = record_size_for(size)
+    written = 0
+    with open(path, "wb") as out:
+        out.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, size, win_length, record_size))
+        chunk = bytearray()
+        for record in records:
+            chunk += record
+            if len(chunk) == CHUNK_RECORDS * record_size:
+                out.write(CHUNK_HEADER.pack(CHUNK_RECORDS, zlib.crc32(chunk)) + chunk)
+                written += CHUNK_RECORDS
+                chunk = bytearray()
+        if chunk:
+            out.write(CHUNK_HEADER.pack(len(chunk) // record_size, zlib.crc32(chunk)) + chunk)
+            written += len(chunk) // record_size
+    return written
+
+
+def read_header(stream):
+    magic, version, size, win_length, record_size = FILE_HEADER.unpack(stream.read(FILE_HEADER.size))
+    if magic != FILE_MAGIC or version != FILE_VERSION or record_size != record_size_for(size):
+        raise ValueError("not a self-play record file")
+    return size, win_length
+
+
+def read_records(path):
+    """
+    Lazily yields (board, move, outcome): board is a list of rows of "", "X"
+    or "O", move is (row, col). Reads one chunk at a time.
+    """
+    unpack = [tuple(byte >> shift & 3 for shift in (0, 2, 4, 6)) for byte in range(256)]
+    with open(path, "rb") as stream:
+        size, _ = read_header(stream)
+        cells = size * size
+        position_size = (cells + 3) // 4
+        record_size = record_size_for(size)
+        while True:
+            header = stream.read(CHUNK_HEADER.size)
+            if not header:
+                return
+            count, crc = CHUNK_HEADER.unpack(header)
+            chunk = stream.read(count * record_size)
+            if len(chunk) != count * record_size or zlib.crc32(chunk) != crc:
+                raise ValueError(f"{path}: corrupt chunk")
+            for offset in range(0, len(chunk), record_size):
+                flat = [MARKS[cell] for byte in chunk[offset:offset + position_size] for cell in unpack[byte]]
+                move, outcome = MOVE_OUTCOME.unpack_from(chunk, offset + position_size)
+                yield [flat[r * size:(r + 1) * size] for r in range(size)], divmod(move, size), outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate tic-tac-toe self-play records.")
+    parser.add_argument("--size", type=int, default=BOARD_SIZE)
+    parser.add_argument("--win-length", type=int, help="marks in a row needed to win (default: the board size)")
+    parser.add_argument("--engines", nargs=2, choices=sorted(ENGINES), default=["greedy", "greedy"],
+                        metavar=("X", "O"), help="engines for X and O: " + ", ".join(sorted(ENGINES)))
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--workers", type=int, help="producer processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="selfplay.bin")
+    args = parser.parse_args()
+    win_length = args.win_length or args.size
+    if not 2 <= args.size <= 255 or not 1 < win_length <= args.size:
+        parser.error("need 2 <= size <= 255 and 1 < win length <= size")
+
+    start = time.perf_counter()
+    seen = 0
+
+    def counted(stream):
+        nonlocal seen
+        for item in stream:
+            seen += 1
+            yield item
+    stream = produce(args.size, win_length, args.engines, args.games, args.workers, args.seed)
+    written = write_records(args.out, args.size, win_length, dedupe(counted(stream)))
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games, {seen} positions, {written} unique written to {args.out} "
+          f"in {elapsed:.1f}s ({seen / elapsed:,.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""
+Snake arena: hundreds of snakes, one of them yours, on one large board.
+
+Every cell of the arena has an entry in a shared occupancy grid (a
+bytearray counting the body segments in it), so moving a snake touches
+only its head and tail cells, whatever its length. A tick:
+1. each snake picks a direction and its next head cell
+2. snakes that are not about to eat give up their tail cell
+3. a head dies on a wall, on an occupied cell, or when it meets another head
+4. surviving heads are added to the grid
+
+Head-on meetings are found through a dict of next head cells. Food items
+live in a list with a cell -> index dict, so eating one (swap-remove) and
+placing a new one (random retry on the grid) are O(1). A tick costs time
+in the number of snakes, plus the cells of the snakes that die in it.
+
+The window shows the part of the arena around your snake.
+"""
+import argparse
+import random
+import tkinter as tk
+from array import array
+from collections import deque
+
+from scene import Scene
+from snake_game import BACKGROUND_COLOR, BODY_PARTS, FOOD_COLOR, GAME_HEIGHT, GAME_WIDTH, SNAKE_COLOR, SPACE_SIZE, SPEED
+
+# --- Arena Constants ---
+ARENA_SIZE = 500 # Cells per side
+SNAKES = 500
+FOOD_ITEMS = 1000
+RESPAWN_TICKS = 20 # Turns a dead bot waits before it comes back
+FOOD_SAMPLES = 4 # Food items a bot looks at when it picks a new target
+PLACE_ATTEMPTS = 100
+BOT_COLORS = ["#1E90FF", "#FFA500", "#DA70D6", "#FFFF00", "#00CED1", "#FF69B4"]
+WALL_COLOR = "#555555"
+MAX_SNAKES = 0xFFFF + 1 # Snake ids are stored per cell as unsigned 16-bit values
+DIRECTIONS = ("up", "down", "left", "right")
+OPPOSITE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+
+
+class ArenaSnake:
+    """One snake: its body as a deque of cell indices, head first."""
+    __slots__ = ("id", "body", "direction", "alive", "bot", "target", "score", "color")
+
+    def __init__(self, snake_id, bot, color):
+        self.id = snake_id
+        self.body = deque()
+        self.direction = "down"
+        self.alive = False
+        self.bot = bot
+        self.target = None # Food cell a bot is heading for
+        self.score = 0
+        self.color = color
+
+
+class Arena:
+    """The arena simulation. Knows nothing about Tk."""
+    def __init__(self, columns=ARENA_SIZE, rows=ARENA_SIZE, snakes=SNAKES, food_items=FOOD_ITEMS, humans=1, seed=None):
+        if snakes > MAX_SNAKES:
+            raise ValueError(f"an arena holds at most {MAX_SNAKES} snakes")
+        self.columns = columns
+        self.rows = rows
+        self.rng = random.Random(seed)
+        self.grid = bytearray(columns * rows) # Body segments per cell
+        self.owner = array("H", bytes(2 * columns * rows)) # Snake that last moved into a cell (for colours)
+        self.food = [] # Food cells
+        self.food_index = {} # Food cell -> its index in self.food
+        self.respawns = deque() # (tick, snake) for dead bots
+        self.ticks = 0
+        self.deaths = 0
+        self.steps = {"up": -columns, "down": columns, "left": -1, "right": 1}
+
+        self.snakes = [ArenaSnake(i, i >= humans, SNAKE_COLOR if i < humans else BOT_COLORS[i % len(BOT_COLORS)])
+                       for i in range(snakes)]
+        for snake in self.snakes:
+            self.spawn(snake)
+        for _ in range(food_items):
+            self.place_food()
+
+    # --- Cells ---
+    def random_empty_cell(self):
+        """Tries random cells until one is free; returns None if the arena looks full."""
+        for _ in range(PLACE_ATTEMPTS):
+            cell = self.rng.randrange(len(self.grid))
+            if not self.grid[cell] and cell not in self.food_index:
+                return cell
+        return None
+
+    def next_cell(self, cell, direction):
+        """The neighbouring cell in a direction, or None past the arena's edge."""
+        x = cell % self.columns
+        if direction == "left" and x == 0 or direction == "right" and x == self.columns - 1:
+            return None
+        cell += self.steps[direction]
+        return cell if 0 <= cell < len(self.grid) else None
+
+    # --- Food ---
+    def place_food(self):
+        cell = self.random_empty_cell()
+        if cell is not None:
+            self.food_index[cell] = len(self.food)
+            self.food.append(cell)
+
+    def eat_food(self, cell):
+        """Removes a food item by swapping the last one into its place, then places a new one."""
+        index = self.food_index.pop(cell)
+        last = self.food.pop()
+        if index < len(self.food):
+            self.food[index] = last
+            self.food_index[last] = index
+        self.place_food()
+
+    # --- Snakes ---
+    def spawn(self, snake):
+        """Puts a snake back in the arena: BODY_PARTS segments on one free cell, like snake_game."""
+        cell = self.random_empty_cell()
+        if cell is None:
+            return False
+        snake.body = deque([cell] * BODY_PARTS)
+        self.grid[cell] += BODY_PARTS
+        self.owner[cell] = snake.id
+        snake.direction = self.rng.choice(DIRECTIONS)
+        snake.alive = True
+        snake.score = 0
+        snake.target = None
+        return True
+
+    def kill(self, snake):
+        for cell in snake.body:
+            self.grid[cell] -= 1
+        snake.body.clear()
+        snake.alive = False
+        self.deaths += 1
+        if snake.bot:
+            self.respawns.append((self.ticks + RESPAWN_TICKS, snake))
+
+    def turn(self, snake, direction):
+        """Changes a snake's direction unless that would reverse it onto itself."""
+        if direction != OPPOSITE[snake.direction]:
+            snake.direction = direction
+
+    def bot_direction(self, snake):
+        """Heads for a food item, avoiding walls and bodies one step ahead."""
+        if snake.target not in self.food_index and self.food:
+            # Closest of a few random food items
+            head = snake.body[0]
+            hx, hy = head % self.columns, head // self.columns
+            samples = [self.food[self.rng.randrange(len(self.food))] for _ in range(FOOD_SAMPLES)]
+            snake.target = min(samples, key=lambda cell: abs(cell % self.columns - hx) + abs(cell // self.columns - hy))
+        head = snake.body[0]
+        hx, hy = head % self.columns, head // self.columns
+        tx, ty = (snake.target % self.columns, snake.target // self.columns) if snake.target is not None else (hx, hy)
+        best = None
+        for direction in DIRECTIONS:
+            if direction == OPPOSITE[snake.direction]:
+                continue
+            cell = self.next_cell(head, direction)
+            blocked = cell is None or self.grid[cell] > 0
+            distance = abs(cell % self.columns - tx) + abs(cell // self.columns - ty) if cell is not None else 0
+            score = (blocked, distance, direction != snake.direction)
+            if best is None or score < best[0]:
+                best = (score, direction)
+        return best[1]
+
+    def tick(self):
+        """
+        Advances every snake one turn. Deaths are all decided against the grid
+        as it stood at the start of the turn (less the tails that move away)
+        and only then applied, so the outcome doesn't depend on snake order.
+        """
+        self.ticks += 1
+        moves = []
+        heads = {}
+        dead = []
+        for snake in self.snakes:
+            if not snake.alive:
+                continue
+            if snake.bot:
+                snake.direction = self.bot_direction(snake)
+            cell = self.next_cell(snake.body[0], snake.direction)
+            if cell is None:
+                dead.append(snake) # Hit the edge: its body still blocks this turn
+                continue
+            moves.append((snake, cell))
+            heads[cell] = heads.get(cell, 0) + 1
+
+        # Tails move first, so a head may follow into the cell a tail leaves this turn
+        for snake, cell in moves:
+            if cell not in self.food_index:
+                self.grid[snake.body.pop()] -= 1
+
+        survivors = []
+        for snake, cell in moves:
+            if self.grid[cell] or heads[cell] > 1:
+                dead.append(snake)
+            else:
+                survivors.append((snake, cell))
+        for snake in dead:
+            self.kill(snake)
+        for snake, cell in survivors:
+            snake.body.appendleft(cell)
+            self.grid[cell] += 1
+            self.owner[cell] = snake.id
+            if cell in self.food_index:
+                snake.score += 1
+                self.eat_food(cell)
+
+        while self.respawns and self.respawns[0][0] <= self.ticks:
+            _, snake = self.respawns.popleft()
+            if not self.spawn(snake):
+                self.respawns.append((self.ticks + RESPAWN_TICKS, snake))
+
+    def alive_count(self):
+        return sum(snake.alive for snake in self.snakes)
+
+
+class ArenaWindow:
+    """Tk view of an arena that follows the player's snake."""
+    def __init__(self, root, arena):
+        self.root = root
+        self.arena = arena
+        self.player = arena.snakes[0]
+        self.view_cells = min(GAME_WIDTH // SPACE_SIZE, arena.columns, arena.rows)
+        self.cell_size = min(GAME_WIDTH, GAME_HEIGHT) // self.view_cells # Cells fill the window
+
+        root.title("Snake Arena")
+        root.resizable(False, False)
+        self.label = tk.Label(root, text="", font=('consolas', 24))
+        self.label.pack()
+        size = self.cell_size * self.view_cells
+        self.canvas = tk.Canvas(root, bg=BACKGROUND_COLOR, height=size, width=size)
+        self.canvas.pack()
+        self.scene = Scene(self.canvas, tag="arena")
+
+        root.bind('<Left>', lambda event: self.arena.turn(self.player, 'left'))
+        root.bind('<Right>', lambda event: self.arena.turn(self.player, 'right'))
+        root.bind('<Up>', lambda event: self.arena.turn(self.player, 'up'))
+        root.bind('<Down>', lambda event: self.arena.turn(self.player, 'down'))
+        root.bind('<space>', lambda event: self.respawn())
+        self.camera = (0, 0)
+        self.draw()
+
+    def respawn(self):
+        if not self.player.alive:
+            self.arena.spawn(self.player)
+            self.draw()
+
+    def draw(self):
+        """Declares the cells in view: bodies, food and the arena's edge."""
+        arena = self.arena
+        columns = arena.columns
+        size = self.cell_size
+        if self.player.alive:
+            # Keep the player's head in the middle of the view, within the arena
+            head = self.player.body[0]
+            half = self.view_cells // 2
+            self.camera = (
+                max(0, min(head % columns - half, columns - self.view_cells)),
+                max(0, min(head // columns - half, arena.rows - self.view_cells)),
+            )
+        left, top = self.camera
+        snakes = arena.snakes
+
+        scene = self.scene
+        scene.begin()
+        for vy in range(self.view_cells):
+            row = (top + vy) * columns + left
+            for vx in range(self.view_cells):
+                cell = row + vx
+                x, y = vx * size, vy * size
+                if arena.grid[cell]:
+                    color = snakes[arena.owner[cell]].color
+                    # Keyed by screen slot: as the view scrolls, items change colour instead of moving
+                    scene.rect(("cell", vx, vy), x, y, x + size, y + size, fill=color, outline="")
+                elif cell in arena.food_index:
+                    scene.oval(("food", vx, vy), x, y, x + size, y + size, fill=FOOD_COLOR, outline="")
+        scene.rect("edge", -left * size, -top * size, (columns - left) * size, (arena.rows - top) * size,
+                   outline=WALL_COLOR, width=3)
+        if not self.player.alive:
+            middle = self.view_cells * size / 2
+            scene.text("gameover", middle, middle - 50, font=('consolas', 50), text="GAME OVER", fill="red")
+            scene.text("respawn", middle, middle + 30, font=('consolas', 20), text="Press Space to respawn", fill="white")
+        scene.end()
+        self.label.config(text="Length:{}  Snakes:{}".format(len(self.player.body), arena.alive_count()))
+
+    def next_turn(self):
+        self.arena.tick()
+        self.draw()
+        self.root.after(SPEED, self.next_turn)
+
+
+def build_window(columns=ARENA_SIZE, rows=ARENA_SIZE, snakes=SNAKES, food_items=FOOD_ITEMS, seed=None):
+    """Creates the arena window and starts it. Returns the Tk root."""
+    root = tk.Tk()
+    root.game = ArenaWindow(root, Arena(columns, rows, snakes, food_items, seed=seed))
+    root.after(SPEED, root.game.next_turn)
+    return root
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Many snakes on one board.")
+    parser.add_argument("--size", type=int, default=ARENA_SIZE, help="cells per side of the arena")
+    parser.add_argument("--snakes", type=int, default=SNAKES, help="snakes, including yours")
+    parser.add_argument("--food", type=int, default=FOOD_ITEMS, help="food items on the board at once")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    if args.size < 2 or args.snakes < 1 or args.food < 0:
+        parser.error("need a size of at least 2, one snake and no negative food")
+    if args.snakes > MAX_SNAKES:
+        parser.error(f"--snakes can be at most {MAX_SNAKES}")
+    build_window(args.size, args.size, args.snakes, args.food, args.seed).mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,12 @@
+import struct
+import sys
 import tkinter as tk
 import random
+from array import array
+
+import profiling
+import rewind
+from scene import Scene
 
 # --- Constants ---
 GAME_WIDTH = 700
@@ -10,27 +17,33 @@ BODY_PARTS = 3
 SNAKE_COLOR = "#00FF00"  # Green
 FOOD_COLOR = "#FF0000"   # Red
 BACKGROUND_COLOR = "#000000" # Black
-
+REWIND_TURNS = 1000 // SPEED # Backspace rewinds one second (also undoes a death)
+SAVE_FILE = "snake.save" # F5 saves, F9 resumes
+
+# --- Game State ---
+# Nothing is created at import time; build_window() sets these up.
+window = None
+label = None
+canvas = None
+snake = None
+food = None
+score = 0
+direction = 'down'
+restart_button = None
+restart_window = None
+scene = None
+history = None # rewind.SnapshotRing of past turns
 
 class Snake:
     """Represents the snake in the game."""
     def __init__(self):
         self.body_size = BODY_PARTS
         self.coordinates = []
-        self.squares = []
 
         # Initialize snake at the top-left corner
         for i in range(0, BODY_PARTS):
             self.coordinates.append([0, 0])
 
-        # Draw the snake
-        for x, y in self.coordinates:
-            square = canvas.create_rectangle(
-                x, y, x + SPACE_SIZE, y + SPACE_SIZE,
-                fill=SNAKE_COLOR, tag="snake"
-            )
-            self.squares.append(square)
-
 
 class Food:
     """Represents the food in the game."""
@@ -41,15 +54,29 @@ class Food:
 
         self.coordinates = [x, y]
 
-        # Draw the food
-        canvas.create_oval(
-            x, y, x + SPACE_SIZE, y + SPACE_SIZE,
-            fill=FOOD_COLOR, tag="food"
+
+def draw(snake, food, game_over=False):
+    """Declares the snake, the food and the game over text for this turn."""
+    scene.begin()
+    for x, y in snake.coordinates:
+        # Keyed by cell: each turn only the tail square moves to the new head
+        scene.rect(("snake", x, y), x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=SNAKE_COLOR)
+    x, y = food.coordinates
+    scene.oval("food", x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=FOOD_COLOR)
+    if game_over:
+        scene.text(
+            "gameover",
+            canvas.winfo_width() / 2,
+            canvas.winfo_height() / 2 - 50,
+            font=('consolas', 70),
+            text="GAME OVER",
+            fill="red"
         )
+    scene.end()
 
 
-def next_turn(snake, food):
-    """Handles all logic for a single game turn."""
+def move_snake(snake, food):
+    """Moves the snake one cell and feeds it; returns the food now on the board."""
     x, y = snake.coordinates[0]
 
     # Update coordinates based on direction
@@ -64,28 +91,29 @@ def next_turn(snake, food):
 
     # Add new head to the snake
     snake.coordinates.insert(0, (x, y))
-    square = canvas.create_rectangle(
-        x, y, x + SPACE_SIZE, y + SPACE_SIZE, fill=SNAKE_COLOR
-    )
-    snake.squares.insert(0, square)
 
     # Check if snake ate the food
     if x == food.coordinates[0] and y == food.coordinates[1]:
         global score
         score += 1
         label.config(text="Score:{}".format(score))
-        canvas.delete("food")
         food = Food()
     else:
         # Remove the tail if no food was eaten
         del snake.coordinates[-1]
-        canvas.delete(snake.squares[-1])
-        del snake.squares[-1]
+    return food
+
+
+def next_turn(snake, food):
+    """Handles all logic for a single game turn."""
+    food = move_snake(snake, food)
 
     # Check for collisions
     if check_collisions(snake):
-        game_over()
+        game_over(snake, food)
     else:
+        draw(snake, food)
+        history.push(capture_snapshot(snake, food))
         # Schedule the next turn
         window.after(SPEED, next_turn, snake, food)
 
@@ -121,23 +149,16 @@ def check_collisions(snake):
     return False
 
 
-def game_over():
+def game_over(snake, food):
     """Displays the Game Over screen and restart button."""
-    global restart_button
-    canvas.create_text(
-        canvas.winfo_width() / 2,
-        canvas.winfo_height() / 2 - 50,
-        font=('consolas', 70),
-        text="GAME OVER",
-        fill="red",
-        tag="gameover"
-    )
-    
+    global restart_button, restart_window
+    draw(snake, food, game_over=True)
+
     # Create and place the restart button
     restart_button = tk.Button(
         window, text="Restart", command=restart_game, font=('consolas', 20)
     )
-    canvas.create_window(
+    restart_window = canvas.create_window(
         canvas.winfo_width() / 2,
         canvas.winfo_height() / 2 + 50,
         window=restart_button
@@ -146,15 +167,14 @@ def game_over():
 
 def restart_game():
     """Resets the game state to start a new game."""
-    global snake, food, score, direction, restart_button
+    global snake, food, score, direction, restart_button, restart_window
 
     # Destroy the restart button widget if it exists
     if restart_button:
+        canvas.delete(restart_window)
         restart_button.destroy()
         restart_button = None
-
-    # Clear the canvas
-    canvas.delete("all")
+        restart_window = None
 
     # Reset game state variables
     score = 0
@@ -169,41 +189,142 @@ def restart_game():
     next_turn(snake, food)
 
 
-# --- Main Window Setup ---
-window = tk.Tk()
-window.title("Snake Game")
-window.resizable(False, False)
+# --- Snapshots ---
+# Layout: a header, then the body as a ring of cell indices (one uint16 per
+# grid cell). The head moves back one ring slot per turn, so from one turn
+# to the next only the header and the new head's slot change.
+COLUMNS = GAME_WIDTH // SPACE_SIZE
+ROWS = GAME_HEIGHT // SPACE_SIZE
+DIRECTIONS = ("up", "down", "left", "right")
+SNAPSHOT_HEADER = struct.Struct("<IHHHIB") # turn, ring head, length, food cell, score, direction
+body_ring = array("H", [0]) * (COLUMNS * ROWS)
+turn = 0
+live_snake = None # The snake and food the scheduled next_turn will move
+live_food = None
+
+
+def capture_snapshot(snake, food):
+    """Encodes the game after a turn."""
+    global turn, live_snake, live_food
+    live_snake, live_food = snake, food
+    cells = len(body_ring)
+    head = -turn % cells
+    for i, (x, y) in enumerate(snake.coordinates):
+        body_ring[(head + i) % cells] = (y // SPACE_SIZE) * COLUMNS + x // SPACE_SIZE
+    fx, fy = food.coordinates
+    header = SNAPSHOT_HEADER.pack(
+        turn, head, len(snake.coordinates), (fy // SPACE_SIZE) * COLUMNS + fx // SPACE_SIZE,
+        score, DIRECTIONS.index(direction),
+    )
+    turn += 1
+    return header + body_ring.tobytes()
+
+
+def restore_snapshot(snapshot):
+    """Puts the game back to a snapshot and redraws it in one pass."""
+    global turn, score, direction, restart_button, restart_window
+    saved_turn, head, length, food_cell, score, direction_index = SNAPSHOT_HEADER.unpack_from(snapshot)
+    body_ring[:] = array("H", snapshot[SNAPSHOT_HEADER.size:])
+    turn = saved_turn + 1
+    direction = DIRECTIONS[direction_index]
+    cells = len(body_ring)
+    # Restore into the objects the game loop holds, so a scheduled turn carries on from here
+    live_snake.coordinates[:] = [
+        ((cell % COLUMNS) * SPACE_SIZE, (cell // COLUMNS) * SPACE_SIZE)
+        for cell in (body_ring[(head + i) % cells] for i in range(length))
+    ]
+    live_snake.body_size = length
+    live_food.coordinates[:] = [(food_cell % COLUMNS) * SPACE_SIZE, (food_cell // COLUMNS) * SPACE_SIZE]
+    label.config(text="Score:{}".format(score))
+    draw(live_snake, live_food)
+
+    if restart_button:
+        # Back from the game over screen: start the loop again
+        canvas.delete(restart_window)
+        restart_button.destroy()
+        restart_button = None
+        restart_window = None
+        window.after(SPEED, next_turn, live_snake, live_food)
+
+
+def rewind_turns(turns=REWIND_TURNS):
+    snapshot = history.rewind(turns)
+    if snapshot:
+        restore_snapshot(snapshot)
 
-score = 0
-direction = 'down'
-restart_button = None
 
-label = tk.Label(window, text="Score:{}".format(score), font=('consolas', 40))
-label.pack()
+def save_game():
+    if len(history):
+        rewind.save_snapshot(SAVE_FILE, "snake", history.get())
 
-canvas = tk.Canvas(window, bg=BACKGROUND_COLOR, height=GAME_HEIGHT, width=GAME_WIDTH)
-canvas.pack()
 
-window.update()
+def load_game():
+    try:
+        snapshot = rewind.load_snapshot(SAVE_FILE, "snake")
+    except (OSError, ValueError):
+        return
+    if len(snapshot) != SNAPSHOT_HEADER.size + len(body_ring) * body_ring.itemsize:
+        return # Saved on a different grid
+    history.clear()
+    history.push(snapshot)
+    restore_snapshot(snapshot)
+
+
+def build_window():
+    """Creates the game window and starts the first game. Returns the Tk root."""
+    global window, label, canvas, scene, history, snake, food, score, direction, restart_button
+
+    # --- Main Window Setup ---
+    window = tk.Tk()
+    window.title("Snake Game")
+    window.resizable(False, False)
+
+    score = 0
+    direction = 'down'
+    restart_button = None
+
+    label = tk.Label(window, text="Score:{}".format(score), font=('consolas', 40))
+    label.pack()
+
+    canvas = tk.Canvas(window, bg=BACKGROUND_COLOR, height=GAME_HEIGHT, width=GAME_WIDTH)
+    canvas.pack()
+    scene = Scene(canvas)
+    history = rewind.SnapshotRing(capacity=rewind.REWIND_SECONDS * 1000 // SPEED)
+
+    window.update()
+
+    # Center the window on the screen
+    window_width = window.winfo_width()
+    window_height = window.winfo_height()
+    screen_width = window.winfo_screenwidth()
+    screen_height = window.winfo_screenheight()
+    x = int((screen_width / 2) - (window_width / 2))
+    y = int((screen_height / 2) - (window_height / 2))
+    window.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+    # --- Key Bindings ---
+    window.bind('<Left>', lambda event: change_direction('left'))
+    window.bind('<Right>', lambda event: change_direction('right'))
+    window.bind('<Up>', lambda event: change_direction('up'))
+    window.bind('<Down>', lambda event: change_direction('down'))
+    window.bind('<BackSpace>', lambda event: rewind_turns())
+    window.bind('<F5>', lambda event: save_game())
+    window.bind('<F9>', lambda event: load_game())
+
+    if profiling.enabled():
+        import telemetry
+        telemetry.attach_snake(sys.modules[__name__])
+
+    # --- Start Game ---
+    snake = Snake()
+    food = Food()
+    next_turn(snake, food)
+    return window
 
-# Center the window on the screen
-window_width = window.winfo_width()
-window_height = window.winfo_height()
-screen_width = window.winfo_screenwidth()
-screen_height = window.winfo_screenheight()
-x = int((screen_width / 2) - (window_width / 2))
-y = int((screen_height / 2) - (window_height / 2))
-window.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
-# --- Key Bindings ---
-window.bind('<Left>', lambda event: change_direction('left'))
-window.bind('<Right>', lambda event: change_direction('right'))
-window.bind('<Up>', lambda event: change_direction('up'))
-window.bind('<Down>', lambda event: change_direction('down'))
+def main():
+    build_window().mainloop()
 
-# --- Start Game ---
-snake = Snake()
-food = Food()
-next_turn(snake, food)
 
-window.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
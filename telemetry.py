@@ -0,0 +1,236 @@
+"""
+Opt-in frame telemetry for the games.
+
+Set GAMES_PROFILE=1 (or pass --profile to the launcher) and a game's
+build_window() attaches a FrameTelemetry to it. The game's update,
+collision and frame methods are wrapped with timers. Telemetry keeps:
+- per-phase latency histograms
+- the after() scheduling lag of the game loop, from each after() call to the frame it schedules
+- the live canvas item count
+
+An on-canvas overlay shows FPS and p99 frame time, and everything is
+written out as JSON lines when the program exits.
+When the variable is unset nothing is imported or wrapped, so the games run exactly as before.
+"""
+import atexit
+import json
+import os
+import time
+from collections import Counter, deque
+
+from profiling import ENV_VAR, enabled # Re-exported: the switch lives in profiling.py
+
+OUTPUT_ENV_VAR = "GAMES_PROFILE_OUT"
+OVERLAY_EVERY = 15 # Frames between overlay refreshes
+ITEM_COUNT_EVERY = 30 # Frames between canvas item counts (find_all is O(items))
+FRAME_LOG_SIZE = 20000 # Per-frame records kept for the dump
+SUB_BITS = 3
+SUB_BUCKETS = 1 << SUB_BITS # Histogram resolution: 8 buckets per power of two (~12%)
+
+
+class Histogram:
+    """A log-linear histogram of microsecond values."""
+    def __init__(self):
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    @staticmethod
+    def _bucket(value):
+        if value < SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - SUB_BITS - 1
+        return (shift + 1) * SUB_BUCKETS + ((value >> shift) & (SUB_BUCKETS - 1))
+
+    @staticmethod
+    def _bucket_floor(index):
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        return (SUB_BUCKETS + index % SUB_BUCKETS) << shift
+
+    def record(self, micros):
+        micros = max(0, int(micros))
+        self.buckets[self._bucket(micros)] += 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def percentile(self, fraction):
+        """Returns the lower bound of the bucket holding the given percentile."""
+        if not self.count:
+            return 0
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return self._bucket_floor(index)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count if self.count else 0,
+            "p50_us": self.percentile(0.50),
+            "p90_us": self.percentile(0.90),
+            "p99_us": self.percentile(0.99),
+            "max_us": self.max,
+            "buckets": {self._bucket_floor(i): n for i, n in sorted(self.buckets.items())},
+        }
+
+
+class FrameTelemetry:
+    """Collects timings for one game and draws the overlay on its canvas."""
+    def __init__(self, name, root, canvas):
+        self.name = name
+        self.root = root
+        self.canvas = canvas
+        self.phases = {}
+        self.frames = 0
+        self.frame_log = deque(maxlen=FRAME_LOG_SIZE)
+        self.recent_starts = deque()
+        self.scheduled = None # (perf_counter_ns, delay ms) of the pending after() for the next frame
+        self.item_count = 0
+        self.max_item_count = 0
+        self.overlay = None
+        self.current = None # Phase timings of the frame in progress
+        self.started = time.time()
+        atexit.register(self.dump)
+
+    def histogram(self, phase):
+        if phase not in self.phases:
+            self.phases[phase] = Histogram()
+        return self.phases[phase]
+
+    def wrap(self, owner, attribute, phase):
+        """Replaces owner.attribute (a method or module function) with a timed version."""
+        function = getattr(owner, attribute)
+        histogram = self.histogram(phase)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter_ns() - start) // 1000
+                histogram.record(elapsed)
+                if self.current is not None:
+                    self.current[phase] = self.current.get(phase, 0) + elapsed
+        setattr(owner, attribute, timed)
+
+    def wrap_frame(self, owner, attribute):
+        """
+        Wraps the game loop itself: frame time, after() lag, item count and overlay.
+        The root's after() is wrapped too, to stamp each call that schedules a frame;
+        a frame that was not scheduled that way (the first one, or a restart after a
+        game over) records no lag.
+        """
+        function = getattr(owner, attribute)
+        frame_histogram = self.histogram("frame")
+        lag_histogram = self.histogram("after_lag")
+        after = self.root.after
+
+        def stamped_after(ms, func=None, *args):
+            if func is frame:
+                self.scheduled = (time.perf_counter_ns(), ms)
+            return after(ms, func, *args)
+
+        def frame(*args, **kwargs):
+            start = time.perf_counter_ns()
+            lag = None
+            if self.scheduled is not None:
+                scheduled_at, delay_ms = self.scheduled
+                lag = max(0, (start - scheduled_at) // 1000 - delay_ms * 1000)
+                lag_histogram.record(lag)
+            self.scheduled = None
+            self.current = {}
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = time.perf_counter_ns()
+                elapsed = (end - start) // 1000
+                frame_histogram.record(elapsed)
+                self.frames += 1
+                if self.frames % ITEM_COUNT_EVERY == 1:
+                    self.item_count = len(self.canvas.find_all())
+                    self.max_item_count = max(self.max_item_count, self.item_count)
+                self.frame_log.append({
+                    "type": "frame", "game": self.name, "frame": self.frames,
+                    "frame_us": elapsed, "lag_us": lag, "items": self.item_count, "phases": self.current,
+                })
+                self.current = None
+                self.recent_starts.append(start)
+                while start - self.recent_starts[0] > 1_000_000_000:
+                    self.recent_starts.popleft()
+                if self.frames % OVERLAY_EVERY == 0:
+                    self.draw_overlay()
+                # Tk redraws the canvas from the idle queue once the loop returns;
+                # an idle callback queued now runs right after that redraw.
+                self.root.after_idle(self.record_redraw, end)
+        setattr(owner, attribute, frame)
+        self.root.after = stamped_after
+
+    def record_redraw(self, frame_end):
+        self.histogram("redraw").record((time.perf_counter_ns() - frame_end) // 1000)
+
+    def draw_overlay(self):
+        text = (f"FPS {len(self.recent_starts)}  "
+                f"p99 {self.phases['frame'].percentile(0.99) / 1000:.1f}ms  "
+                f"items {self.item_count}")
+        if self.overlay is None or not self.canvas.type(self.overlay):
+            # The games clear the canvas with delete("all"), so recreate when needed
+            self.overlay = self.canvas.create_text(
+                6, 6, anchor="nw", text=text, fill="yellow", font=("consolas", 10), tags="telemetry"
+            )
+        else:
+            self.canvas.itemconfig(self.overlay, text=text)
+        self.canvas.tag_raise(self.overlay)
+
+    def dump(self, path=None):
+        """Writes the per-frame log and the histogram summaries as JSON lines."""
+        path = path or os.environ.get(OUTPUT_ENV_VAR) or f"telemetry-{self.name}-{os.getpid()}.jsonl"
+        with open(path, "w") as out:
+            out.write(json.dumps({
+                "type": "session", "game": self.name, "started": self.started,
+                "frames": self.frames, "max_items": self.max_item_count,
+            }) + "\n")
+            for phase, histogram in self.phases.items():
+                out.write(json.dumps({"type": "histogram", "game": self.name, "phase": phase, **histogram.summary()}) + "\n")
+            for record in self.frame_log:
+                out.write(json.dumps(record) + "\n")
+        return path
+
+
+# --- Per-game wiring ---
+# The phases follow each game loop: update, collision, and the whole frame.
+# "redraw" is Tk's own canvas redraw after the frame returns.
+
+def attach_breakout(root, game):
+    telemetry = FrameTelemetry("breakout", root, game.canvas)
+    telemetry.wrap(game, "move_ball", "update")
+    telemetry.wrap(game, "check_collisions", "collision")
+    telemetry.wrap_frame(game, "game_loop")
+    return telemetry
+
+
+def attach_flappy(root, game):
+    telemetry = FrameTelemetry("flappy", root, game.canvas)
+    telemetry.wrap(game, "update_pipes", "update")
+    telemetry.wrap(game, "update_scenery", "update")
+    telemetry.wrap(game, "check_collisions", "collision")
+    telemetry.wrap_frame(game, "game_loop")
+    return telemetry
+
+
+def attach_snake(module):
+    # next_turn calls its steps and reschedules itself by their global names,
+    # so wrapping the module attributes is enough
+    telemetry = FrameTelemetry("snake", module.window, module.canvas)
+    telemetry.wrap(module, "move_snake", "update")
+    telemetry.wrap(module, "check_collisions", "collision")
+    telemetry.wrap(module, "draw", "render")
+    telemetry.wrap_frame(module, "next_turn")
+    return telemetry
@@ -1,27 +1,69 @@
+import argparse
 import tkinter as tk
 from tkinter import font as tkfont
 
+# --- Board Constants ---
+BOARD_SIZE = 3
+CELL_SIZE = 120 # Cell size in pixels for the classic 3x3 board
+CELL_GAP = 10
+MAX_BOARD_PIXELS = BOARD_SIZE * CELL_SIZE # Larger boards shrink their cells to fit
+MIN_CELL_SIZE = 24
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1)) # Row, column and both diagonals
+
+
+def winning_line(board, player, win_length=None, last_move=None):
+    """
+    Returns the cells of a run of `win_length` marks for player, or None.
+    If last_move is given only the lines through that cell are checked.
+    """
+    size = len(board)
+    n = win_length or size
+    if last_move is None:
+        starts = [(r, c) for r in range(size) for c in range(size)]
+    else:
+        starts = [last_move]
+    for r0, c0 in starts:
+        for dr, dc in LINE_DIRECTIONS:
+            # Slide a window of n cells along the direction so that it covers (r0, c0)
+            for back in range(n if last_move is not None else 1):
+                r, c = r0 - dr * back, c0 - dc * back
+                end_r, end_c = r + dr * (n - 1), c + dc * (n - 1)
+                if not (0 <= r < size and 0 <= c < size and 0 <= end_r < size and 0 <= end_c < size):
+                    continue
+                if all(board[r + dr * i][c + dc * i] == player for i in range(n)):
+                    return [(r + dr * i, c + dc * i) for i in range(n)]
+    return None
+
+
+def is_full(board):
+    """Checks if every cell of the board is taken."""
+    return all(cell != "" for row in board for cell in row)
+
+
 class TicTacToe(tk.Tk):
     """
     A stylish and animated Tic-Tac-Toe game using Python's Tkinter library.
     """
-    def __init__(self):
+    def __init__(self, board_size=BOARD_SIZE, win_length=None):
         super().__init__()
         self.title("Playful Tic-Tac-Toe")
         self.configure(bg="#2c3e50") # Dark blue background
 
         # --- Game State ---
+        self.board_size = board_size
+        self.win_length = win_length or board_size
         self.current_player = "X"
-        self.board = [["" for _ in range(3)] for _ in range(3)]
-        self.buttons = [[None for _ in range(3)] for _ in range(3)]
+        self.board = [["" for _ in range(board_size)] for _ in range(board_size)]
         self.game_over = False
+        self.hover_cell = None
 
         # --- Styling ---
         self.player_colors = {"X": "#e74c3c", "O": "#3498db"} # Red for X, Blue for O
-        self.base_bg = "#34495e" # Slightly lighter blue for buttons
+        self.base_bg = "#34495e" # Slightly lighter blue for cells
         self.hover_bg = "#4a6274" # Hover color
         self.win_bg = "#2ecc71" # Green for winning line
-        self.font_style = tkfont.Font(family="Poppins", size=36, weight="bold")
+        self.cell_size = max(MIN_CELL_SIZE, min(CELL_SIZE, MAX_BOARD_PIXELS // board_size))
+        self.font_style = None # The mark font is created with the first mark
         self.info_font = tkfont.Font(family="Poppins", size=14)
 
         # --- UI Setup ---
@@ -43,38 +85,85 @@ class TicTacToe(tk.Tk):
         )
         self.info_label.pack()
 
-        board_frame = tk.Frame(main_frame, bg="#2c3e50")
-        board_frame.pack()
-
-        for r in range(3):
-            for c in range(3):
-                button = tk.Button(
-                    board_frame,
-                    text="",
-                    font=self.font_style,
-                    width=4,
-                    height=2,
-                    bg=self.base_bg,
-                    fg="white",
-                    relief="flat",
-                    command=lambda r=r, c=c: self.on_button_click(r, c),
-                    disabledforeground="white"
-                )
-                button.grid(row=r, column=c, padx=5, pady=5)
-                # --- Animations on Hover ---
-                button.bind("<Enter>", lambda e, b=button: self.on_hover(e, b))
-                button.bind("<Leave>", lambda e, b=button: self.on_leave(e, b))
-                self.buttons[r][c] = button
-    
-    def on_hover(self, event, button):
-        """Change button color on hover if it's active."""
-        if button['state'] == 'normal':
-            button.config(bg=self.hover_bg)
-
-    def on_leave(self, event, button):
-        """Change button color back when mouse leaves."""
-        button.config(bg=self.base_bg)
+        # --- Board Canvas ---
+        # The whole board is a single canvas: one rectangle and one text item per cell,
+        # with clicks and hover resolved arithmetically instead of per-widget bindings.
+        pitch = self.cell_size + CELL_GAP
+        board_pixels = self.board_size * pitch + CELL_GAP
+        self.canvas = tk.Canvas(
+            main_frame,
+            width=board_pixels,
+            height=board_pixels,
+            bg="#2c3e50",
+            highlightthickness=0
+        )
+        self.canvas.pack()
+        self._draw_board()
 
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.bind("<Motion>", self.on_hover)
+        self.canvas.bind("<Leave>", self.on_leave)
+
+    def _draw_board(self):
+        """Draws every cell background. Marks are only created once they are played."""
+        pitch = self.cell_size + CELL_GAP
+        self.cell_items = []
+        for r in range(self.board_size):
+            for c in range(self.board_size):
+                x = CELL_GAP + c * pitch
+                y = CELL_GAP + r * pitch
+                self.cell_items.append(self.canvas.create_rectangle(
+                    x, y, x + self.cell_size, y + self.cell_size,
+                    fill=self.base_bg, outline="", tags="cell"
+                ))
+
+    def _draw_mark(self, r, c, player):
+        """Draws a player's mark in the center of a cell."""
+        if self.font_style is None:
+            size = max(8, self.cell_size * 36 // CELL_SIZE)
+            self.font_style = tkfont.Font(family="Poppins", size=size, weight="bold")
+        pitch = self.cell_size + CELL_GAP
+        center = CELL_GAP + self.cell_size / 2
+        self.canvas.create_text(
+            center + c * pitch, center + r * pitch,
+            text=player, font=self.font_style, fill=self.player_colors[player], tags="mark"
+        )
+
+    def cell_at(self, x, y):
+        """Maps canvas pixel coordinates to a (row, col) cell, or None in the gaps."""
+        pitch = self.cell_size + CELL_GAP
+        c, dx = divmod(int(x) - CELL_GAP, pitch)
+        r, dy = divmod(int(y) - CELL_GAP, pitch)
+        if 0 <= r < self.board_size and 0 <= c < self.board_size and dx < self.cell_size and dy < self.cell_size:
+            return r, c
+        return None
+
+    def _set_cell_bg(self, r, c, color):
+        self.canvas.itemconfig(self.cell_items[r * self.board_size + c], fill=color)
+
+    def on_canvas_click(self, event):
+        """Routes a click on the board canvas to the cell under the pointer."""
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_button_click(*cell)
+
+    def on_hover(self, event):
+        """Highlights the empty cell under the pointer."""
+        cell = self.cell_at(event.x, event.y)
+        if cell == self.hover_cell:
+            return
+        self.on_leave(event)
+        if cell is not None and self.board[cell[0]][cell[1]] == "":
+            self._set_cell_bg(*cell, self.hover_bg)
+            self.hover_cell = cell
+
+    def on_leave(self, event):
+        """Change the hovered cell back to its base color."""
+        if self.hover_cell is not None:
+            r, c = self.hover_cell
+            self.hover_cell = None
+            if self.board[r][c] == "":
+                self._set_cell_bg(r, c, self.base_bg)
 
     def on_button_click(self, r, c):
         """Handles the logic when a game board button is clicked."""
@@ -82,13 +171,14 @@ class TicTacToe(tk.Tk):
             # Update board state
             self.board[r][c] = self.current_player
             
-            # Update button UI
-            button = self.buttons[r][c]
-            button.config(text=self.current_player, fg=self.player_colors[self.current_player], state="disabled")
-            self.on_leave(None, button) # Reset background to base color after click
+            # Update cell UI
+            self._draw_mark(r, c, self.current_player)
+            if self.hover_cell == (r, c):
+                self.hover_cell = None
+            self._set_cell_bg(r, c, self.base_bg) # Reset background to base color after click
 
             # Check for game end
-            if self.check_winner(self.current_player):
+            if self.check_winner(self.current_player, last_move=(r, c)):
                 self.highlight_winner(self.current_player)
                 self.game_over = True
                 self.show_end_game_popup(f"Player {self.current_player} wins!")
@@ -105,50 +195,18 @@ class TicTacToe(tk.Tk):
         text = f"Player {self.current_player}'s Turn"
         self.info_label.config(text=text, fg=self.player_colors[self.current_player])
 
-    def check_winner(self, player):
+    def check_winner(self, player, last_move=None):
         """Checks rows, columns, and diagonals for a win."""
-        # Check rows
-        for r in range(3):
-            if all(self.board[r][c] == player for c in range(3)):
-                return True
-        # Check columns
-        for c in range(3):
-            if all(self.board[r][c] == player for r in range(3)):
-                return True
-        # Check diagonals
-        if all(self.board[i][i] == player for i in range(3)):
-            return True
-        if all(self.board[i][2 - i] == player for i in range(3)):
-            return True
-        return False
+        return winning_line(self.board, player, self.win_length, last_move) is not None
 
     def is_draw(self):
         """Checks if the game is a draw."""
-        return all(self.board[r][c] != "" for r in range(3) for c in range(3))
+        return is_full(self.board)
 
     def highlight_winner(self, player):
-        """Highlights the winning combination of buttons."""
-        # Rows
-        for r in range(3):
-            if all(self.board[r][c] == player for c in range(3)):
-                for c in range(3):
-                    self.buttons[r][c].config(bg=self.win_bg)
-                return
-        # Columns
-        for c in range(3):
-            if all(self.board[r][c] == player for r in range(3)):
-                for r in range(3):
-                    self.buttons[r][c].config(bg=self.win_bg)
-                return
-        # Diagonals
-        if all(self.board[i][i] == player for i in range(3)):
-            for i in range(3):
-                self.buttons[i][i].config(bg=self.win_bg)
-            return
-        if all(self.board[i][2 - i] == player for i in range(3)):
-            for i in range(3):
-                self.buttons[i][2 - i].config(bg=self.win_bg)
-            return
+        """Highlights the winning combination of cells."""
+        for r, c in winning_line(self.board, player, self.win_length) or ():
+            self._set_cell_bg(r, c, self.win_bg)
 
     def _handle_play_again(self, popup):
         """Helper function to reset the game and close the popup."""
@@ -197,14 +255,40 @@ class TicTacToe(tk.Tk):
     def reset_game(self):
         """Resets the game to its initial state."""
         self.current_player = "X"
-        self.board = [["" for _ in range(3)] for _ in range(3)]
+        self.board = [["" for _ in range(self.board_size)] for _ in range(self.board_size)]
         self.game_over = False
-        for r in range(3):
-            for c in range(3):
-                button = self.buttons[r][c]
-                button.config(text="", state="normal", bg=self.base_bg)
+        self.hover_cell = None
+        # Two bulk operations by tag instead of one configure call per cell
+        self.canvas.delete("mark")
+        self.canvas.itemconfig("cell", fill=self.base_bg)
         self.update_info_label()
 
+def build_window(board_size=BOARD_SIZE, win_length=None, server=None, opponent="any"):
+    """Creates the game window, optionally connected to a match server. Returns the Tk root."""
+    if server:
+        from tictactoe_server import NetworkTicTacToe
+        host, _, port = server.rpartition(":")
+        return NetworkTicTacToe(host or "127.0.0.1", int(port), board_size, win_length, opponent)
+    return TicTacToe(board_size=board_size, win_length=win_length)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Playful Tic-Tac-Toe")
+    parser.add_argument("--size", type=int, default=BOARD_SIZE, help="cells per side of the board")
+    parser.add_argument("--win-length", type=int, default=None, help="marks in a row needed to win (default: board size)")
+    parser.add_argument("--server", metavar="HOST:PORT", help="play online through a tictactoe_server.py match server")
+    parser.add_argument("--opponent", choices=["any", "bot"], default="any", help="who to be matched with online")
+    args = parser.parse_args(argv)
+    win_length = args.size if args.win_length is None else args.win_length
+    if not 1 <= win_length <= args.size:
+        parser.error("--win-length must be between 1 and --size")
+    if args.server:
+        from tictactoe_server import MAX_BOARD_SIZE
+        if args.size > MAX_BOARD_SIZE:
+            parser.error(f"the match server plays boards of up to {MAX_BOARD_SIZE} cells per side")
+
+    build_window(args.size, win_length, args.server, args.opponent).mainloop()
+
+
 if __name__ == "__main__":
-    app = TicTacToe()
-    app.mainloop()
+    main()
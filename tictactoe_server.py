@@ -0,0 +1,343 @@
+import argparse
+import asyncio
+import random
+import socket
+import time
+
+from tick_tack_toe import BOARD_SIZE, TicTacToe, is_full, winning_line
+
+# --- Server Constants ---
+HOST = "127.0.0.1"
+PORT = 8765
+MOVE_TIMEOUT = 30.0 # Seconds a player may think before forfeiting
+IDLE_TIMEOUT = 120.0 # Seconds a connection may stay silent outside a game
+MAX_BOARD_SIZE = 19
+MAX_LINE = 64
+
+# --- Protocol ---
+# One ASCII command per line, fields separated by single spaces.
+#   client -> server:  PLAY <size> <win_length> <any|bot>
+#                      MOVE <row> <col>
+#                      QUIT
+#   server -> client:  START <mark> <size> <win_length>
+#                      MOVED <mark> <row> <col>
+#                      END <X|O|DRAW> <line|full|timeout|left>
+#                      ERR <reason>
+
+
+def greedy_move(board, mark, win_length=None, rng=random):
+    """A simple bot: win if possible, otherwise block, otherwise play randomly."""
+    other = "O" if mark == "X" else "X"
+    empty = [(r, c) for r, row in enumerate(board) for c, cell in enumerate(row) if cell == ""]
+    for player in (mark, other):
+        for r, c in empty:
+            board[r][c] = player
+            won = winning_line(board, player, win_length, (r, c)) is not None
+            board[r][c] = ""
+            if won:
+                return r, c
+    return rng.choice(empty)
+
+
+class Match:
+    """Server-side state of one game between two seats."""
+    def __init__(self, server, size, win_length):
+        self.server = server
+        self.size = size
+        self.win_length = win_length
+        self.board = [["" for _ in range(size)] for _ in range(size)]
+        self.current_player = "X"
+        self.seats = {} # Mark -> Session, or None for the built-in bot
+        self.over = False
+        self.timer = None
+
+    def start(self):
+        for mark, session in self.seats.items():
+            if session is not None:
+                session.match = self
+                session.mark = mark
+                session.send(f"START {mark} {self.size} {self.win_length}")
+        self.server.active_matches += 1
+        self._next_turn()
+
+    def _next_turn(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.seats[self.current_player] is None:
+            r, c = greedy_move(self.board, self.current_player, self.win_length)
+            self.play(self.current_player, r, c)
+        else:
+            loop = asyncio.get_running_loop()
+            self.timer = loop.call_later(self.server.move_timeout, self.finish, self._other(), "timeout")
+
+    def _other(self):
+        return "O" if self.current_player == "X" else "X"
+
+    def play(self, mark, r, c):
+        """Validates and applies a move; returns an error string or None."""
+        if self.over:
+            return "game over"
+        if mark != self.current_player:
+            return "not your turn"
+        if not (0 <= r < self.size and 0 <= c < self.size):
+            return "off board"
+        if self.board[r][c] != "":
+            return "cell taken"
+
+        self.board[r][c] = mark
+        self.server.moves += 1
+        self.broadcast(f"MOVED {mark} {r} {c}")
+        if winning_line(self.board, mark, self.win_length, (r, c)) is not None:
+            self.finish(mark, "line")
+        elif is_full(self.board):
+            self.finish("DRAW", "full")
+        else:
+            self.current_player = self._other()
+            self._next_turn()
+        return None
+
+    def broadcast(self, line):
+        for session in self.seats.values():
+            if session is not None:
+                session.send(line)
+
+    def finish(self, result, reason):
+        if self.over:
+            return
+        self.over = True
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.broadcast(f"END {result} {reason}")
+        for session in self.seats.values():
+            if session is not None:
+                session.match = None
+                session.idle_since = time.monotonic() # Back to the idle timeout
+        self.server.active_matches -= 1
+        self.server.finished_matches += 1
+
+
+class Session:
+    """One client connection."""
+    def __init__(self, server, writer):
+        self.server = server
+        self.writer = writer
+        self.match = None
+        self.mark = None
+        self.idle_since = time.monotonic() # Last line received, or the end of the last match
+
+    def send(self, line):
+        if not self.writer.is_closing():
+            self.writer.write(line.encode("ascii") + b"\n")
+
+    def handle(self, line):
+        parts = line.split()
+        if not parts:
+            return
+        command, args = parts[0].upper(), parts[1:]
+        try:
+            if command == "PLAY":
+                self.on_play(args)
+            elif command == "MOVE":
+                self.on_move(args)
+            elif command == "QUIT":
+                self.leave()
+                self.writer.close()
+            else:
+                self.send("ERR unknown command")
+        except ValueError:
+            self.send("ERR bad arguments")
+
+    def on_play(self, args):
+        if self.match is not None:
+            self.send("ERR already playing")
+            return
+        size = int(args[0]) if len(args) > 0 else BOARD_SIZE
+        win_length = int(args[1]) if len(args) > 1 else size
+        opponent = args[2].lower() if len(args) > 2 else "any"
+        if not (1 <= win_length <= size <= MAX_BOARD_SIZE) or opponent not in ("any", "bot"):
+            self.send("ERR bad arguments")
+            return
+        # A new PLAY replaces a wait from an earlier one, so a session is only ever queued once
+        self.server.dequeue(self)
+        self.server.enqueue(self, size, win_length, opponent)
+
+    def on_move(self, args):
+        if self.match is None:
+            self.send("ERR not in a game")
+            return
+        if len(args) != 2:
+            self.send("ERR bad arguments")
+            return
+        error = self.match.play(self.mark, int(args[0]), int(args[1]))
+        if error:
+            self.send(f"ERR {error}")
+
+    def leave(self):
+        self.server.dequeue(self)
+        if self.match is not None:
+            match = self.match
+            match.finish("O" if self.mark == "X" else "X", "left")
+
+
+class MatchServer:
+    """Pairs connections into matches and runs every match on one event loop."""
+    def __init__(self, move_timeout=MOVE_TIMEOUT, idle_timeout=IDLE_TIMEOUT):
+        self.move_timeout = move_timeout
+        self.idle_timeout = idle_timeout
+        self.waiting = {} # (size, win_length) -> Session waiting for an opponent
+        self.active_matches = 0
+        self.finished_matches = 0
+        self.moves = 0
+
+    def enqueue(self, session, size, win_length, opponent):
+        if opponent == "bot":
+            match = Match(self, size, win_length)
+            bot_mark = random.choice("XO")
+            match.seats = {bot_mark: None, ("O" if bot_mark == "X" else "X"): session}
+            match.start()
+            return
+        key = (size, win_length)
+        waiting = self.waiting.pop(key, None)
+        if waiting is None or waiting is session:
+            self.waiting[key] = session
+            return
+        match = Match(self, size, win_length)
+        match.seats = {"X": waiting, "O": session}
+        match.start()
+
+    def dequeue(self, session):
+        for key, waiting in list(self.waiting.items()):
+            if waiting is session:
+                del self.waiting[key]
+
+    async def handle_client(self, reader, writer):
+        session = Session(self, writer)
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while not writer.is_closing():
+                # A player in a game is policed by the match's move timer instead. The
+                # wait still wakes up every idle_timeout, so a match that ends while
+                # it is pending starts the idle clock
+                if session.match is None:
+                    timeout = session.idle_since + self.idle_timeout - time.monotonic()
+                    if timeout <= 0:
+                        break
+                else:
+                    timeout = self.idle_timeout
+                try:
+                    line = await asyncio.wait_for(reader.readline(), timeout)
+                except asyncio.TimeoutError:
+                    continue
+                if not line:
+                    break
+                session.idle_since = time.monotonic()
+                if len(line) > MAX_LINE:
+                    session.send("ERR line too long")
+                    break
+                session.handle(line.decode("ascii", "replace"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            session.leave()
+            writer.close()
+
+    async def serve(self, host=HOST, port=PORT):
+        server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+        async with server:
+            await server.serve_forever()
+
+
+class NetworkTicTacToe(TicTacToe):
+    """
+    A TicTacToe window whose moves go through a match server.
+    Clicks are sent as MOVE commands and the board only changes when the
+    server echoes them back, so both windows stay in step.
+    """
+    def __init__(self, host=HOST, port=PORT, board_size=BOARD_SIZE, win_length=None, opponent="any"):
+        self.my_mark = None
+        self.opponent = opponent
+        self.sock = socket.create_connection((host, port))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setblocking(False)
+        self.inbox = b""
+        super().__init__(board_size=board_size, win_length=win_length)
+        self.title("Playful Tic-Tac-Toe (online)")
+        self.request_game()
+        self.after(20, self.poll_server)
+
+    def send(self, line):
+        self.sock.sendall(line.encode("ascii") + b"\n")
+
+    def request_game(self):
+        self.my_mark = None
+        self.send(f"PLAY {self.board_size} {self.win_length} {self.opponent}")
+        self.update_info_label()
+
+    def poll_server(self):
+        """Reads whatever the server has sent without blocking the Tk loop."""
+        try:
+            while True:
+                data = self.sock.recv(4096)
+                if not data:
+                    self.info_label.config(text="Disconnected from server", fg="white")
+                    return
+                self.inbox += data
+        except BlockingIOError:
+            pass
+        *lines, self.inbox = self.inbox.split(b"\n")
+        for line in lines:
+            self.on_server_line(line.decode("ascii").split())
+        self.after(20, self.poll_server)
+
+    def on_server_line(self, parts):
+        if not parts:
+            return
+        if parts[0] == "START":
+            self.my_mark = parts[1]
+            self.update_info_label()
+        elif parts[0] == "MOVED":
+            self.current_player = parts[1]
+            super().on_button_click(int(parts[2]), int(parts[3]))
+        elif parts[0] == "END" and not self.game_over:
+            # The rules already ended the game locally unless it was a timeout or a leaver
+            self.game_over = True
+            message = "It's a draw!" if parts[1] == "DRAW" else f"Player {parts[1]} wins ({parts[2]})!"
+            self.show_end_game_popup(message)
+        elif parts[0] == "ERR":
+            self.info_label.config(text="Server: " + " ".join(parts[1:]), fg="white")
+
+    def on_button_click(self, r, c):
+        """Sends the move to the server instead of applying it directly."""
+        if self.current_player == self.my_mark and self.board[r][c] == "" and not self.game_over:
+            self.send(f"MOVE {r} {c}")
+
+    def update_info_label(self):
+        if getattr(self, "my_mark", None) is None:
+            self.info_label.config(text="Waiting for an opponent...", fg="white")
+        elif self.current_player == self.my_mark:
+            self.info_label.config(text=f"You are {self.my_mark}: your turn", fg=self.player_colors[self.my_mark])
+        else:
+            self.info_label.config(text=f"You are {self.my_mark}: opponent's turn", fg=self.player_colors[self.current_player])
+
+    def reset_game(self):
+        super().reset_game()
+        self.request_game()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tic-Tac-Toe match server")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--move-timeout", type=float, default=MOVE_TIMEOUT)
+    args = parser.parse_args()
+
+    print(f"Serving tic-tac-toe on {args.host}:{args.port}")
+    try:
+        asyncio.run(MatchServer(move_timeout=args.move_timeout).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass